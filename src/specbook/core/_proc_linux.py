@@ -0,0 +1,69 @@
+"""Linux /proc lookups used by the server utilities in place of psutil's per-process scans."""
+
+import os
+
+# kernel socket tables for the current network namespace
+_TCP_TABLES = ("/proc/net/tcp", "/proc/net/tcp6")
+
+# TCP_LISTEN, as printed in the "st" column of the socket tables
+_TCP_LISTEN = "0A"
+
+
+def _listening_inodes(port: int) -> set[str] | None:
+    """socket inodes listening on port; None if no socket table could be read"""
+    inodes: set[str] = set()
+    readable = False
+    for table in _TCP_TABLES:
+        try:
+            with open(table, encoding="ascii") as f:
+                readable = True
+                next(f, None)  # column header
+                for line in f:
+                    # sl local_address rem_address st tx:rx tr:tm retrnsmt uid timeout inode
+                    fields = line.split()
+                    if len(fields) < 10 or fields[3] != _TCP_LISTEN:
+                        continue
+                    if int(fields[1].rpartition(":")[2], 16) == port:
+                        inodes.add(fields[9])
+        except OSError:
+            continue
+    return inodes if readable else None
+
+
+def find_pid_on_port(port: int) -> int | None:
+    """pid of the process listening on port, or None when none is found
+
+    reads the socket tables once and then matches `socket:[inode]` fd links, instead
+    of parsing every process's own view of the tables; processes whose fds can't be
+    read (e.g. other users') are skipped
+
+    raises OSError when /proc is unavailable, so callers can fall back to psutil
+    """
+    inodes = _listening_inodes(port)
+    if inodes is None:
+        raise OSError("no readable socket tables under /proc/net")
+    if not inodes:
+        return None
+
+    targets = {f"socket:[{inode}]" for inode in inodes}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        fd_dir = f"/proc/{name}/fd"
+        try:
+            fds = os.listdir(fd_dir)
+        except OSError:
+            continue
+        for fd in fds:
+            try:
+                if os.readlink(f"{fd_dir}/{fd}") in targets:
+                    return int(name)
+            except OSError:
+                continue
+    return None
+
+
+def read_cmdline(pid: int) -> bytes:
+    """raw NUL-separated command line of pid (raises OSError if gone or unreadable)"""
+    with open(f"/proc/{pid}/cmdline", "rb") as f:
+        return f.read()
@@ -1,8 +1,11 @@
 """Data models for specbook project root detection and server management."""
 
+import heapq
+import os
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from typing import Literal
 
 __all__ = [
     "ProjectRoot",
@@ -141,12 +144,11 @@ class SpecStatus(Enum):
 
         # normalize string
         normalized = value.lower().strip().replace("_", "-")
+        return _SPEC_STATUS_BY_VALUE.get(normalized, cls.UNKNOWN)
 
-        for status in cls:
-            if status.value == normalized:
-                return status
 
-        return cls.UNKNOWN
+# value -> member lookup for SpecStatus.from_string (avoids scanning the enum per call)
+_SPEC_STATUS_BY_VALUE: dict[str, SpecStatus] = {status.value: status for status in SpecStatus}
 
 
 @dataclass
@@ -183,7 +185,7 @@ class ServerStatus:
         return self.state == ServerState.PORT_CONFLICT
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SpecDirectory:
     """specification directory for display"""
 
@@ -198,8 +200,22 @@ class SpecDirectory:
         """create from a directory path"""
         return cls(name=path.name, path=path)
 
+    @staticmethod
+    def sort_key(name: str) -> tuple[int, int, str]:
+        """display order for spec names: by numeric prefix (so '10-x' follows '9-x'),
+        then by name; names without a numeric prefix sort last"""
+        prefix = name.partition("-")[0]
+        if prefix.isascii() and prefix.isdigit():
+            return (0, int(prefix), name)
+        return (1, 0, name)
 
-@dataclass
+
+def _entry_sort_key(entry: os.DirEntry[str]) -> tuple[int, int, str]:
+    """SpecDirectory.sort_key for a scanned directory entry"""
+    return SpecDirectory.sort_key(entry.name)
+
+
+@dataclass(slots=True, frozen=True)
 class SpecListing:
     """all spec directories in a project"""
 
@@ -207,7 +223,8 @@ class SpecListing:
     """path to the project root"""
 
     specs: list[SpecDirectory]
-    """list of spec directories, sorted by name"""
+    """list of spec directories, in SpecDirectory.sort_key order (unless from_project
+    was asked otherwise)"""
 
     @property
     def is_empty(self) -> bool:
@@ -215,21 +232,45 @@ class SpecListing:
         return len(self.specs) == 0
 
     @classmethod
-    def from_project(cls, project_root: Path) -> "SpecListing":
-        """scan project and build spec listing"""
-        specs_dir = project_root / "specs"
-        if not specs_dir.is_dir():
+    def from_project(
+        cls,
+        project_root: Path,
+        sort: Literal["name", "inode"] | None = "name",
+        limit: int | None = None,
+    ) -> "SpecListing":
+        """scan project and build spec listing
+
+        sort="name" orders specs for display (SpecDirectory.sort_key); sort="inode"
+        orders them by inode number, so callers that go on to stat or read every spec
+        visit the inode table roughly sequentially on a cold cache; None keeps readdir
+        order
+
+        limit keeps only the first `limit` specs in that order; for very large specs/
+        directories this is a partial heap sort rather than a full one
+        """
+        # scandir entries reuse the readdir file type, avoiding a stat() per entry;
+        # filter first so only spec directories are sorted. a missing specs/ raises
+        # from scandir itself, so there is no separate is_dir() stat up front
+        try:
+            with os.scandir(project_root / "specs") as it:
+                entries = [e for e in it if not e.name.startswith(".") and e.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
             return cls(project_root=project_root, specs=[])
-
-        specs = [
-            SpecDirectory.from_path(p)
-            for p in sorted(specs_dir.iterdir())
-            if p.is_dir() and not p.name.startswith(".")
-        ]
+        if sort is None:
+            if limit is not None:
+                entries = entries[: max(limit, 0)]
+        else:
+            # DirEntry.inode() comes from readdir on POSIX, so either key is stat-free
+            key = _entry_sort_key if sort == "name" else os.DirEntry.inode
+            if limit is not None and limit < len(entries):
+                entries = heapq.nsmallest(limit, entries, key=key)
+            else:
+                entries.sort(key=key)
+        specs = [SpecDirectory(name=e.name, path=Path(e.path)) for e in entries]
         return cls(project_root=project_root, specs=specs)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProjectDocument:
     """project-level document for sidebar display"""
 
@@ -243,7 +284,7 @@ class ProjectDocument:
     """grouping: 'guide' for constitution/agent, 'memory' for .specify/memory/"""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SpecDocument:
     """document within a spec directory"""
 
@@ -259,17 +300,13 @@ class SpecDocument:
     doc_type: str
     """type identifier: 'spec', 'plan', 'tasks', 'research', 'data-model', 'quickstart', 'other'"""
 
-    status: "SpecStatus" = None  # type: ignore[assignment]
+    status: SpecStatus = SpecStatus.UNKNOWN
     """workflow status from doc frontmatter
     TODO: consider all docs in spec dir to determine status
     """
 
-    def __post_init__(self) -> None:
-        if self.status is None:
-            self.status = SpecStatus.UNKNOWN
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CompletionStatus:
     """completion status for a spec"""
 
@@ -296,7 +333,7 @@ class CompletionStatus:
         return int((self.completed_tasks / self.total_tasks) * 100)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SpecDirectoryExpanded:
     """specification directory with documents and completion status"""
 
@@ -1,18 +1,44 @@
 """Server management utilities for specbook web server."""
 
+import os
 import subprocess
 import sys
 import time
-import webbrowser
 from pathlib import Path
 
 import psutil
 
+from specbook.core._proc_linux import find_pid_on_port, read_cmdline
 from specbook.core.models import ServerConfig, ServerState, ServerStatus
 
+# psutil error raised when another user's process can't be inspected; re-exported so
+# callers (and tests) don't need psutil themselves
+AccessDenied = psutil.AccessDenied
+
+# states bound once for the status path (plain global loads instead of enum lookups)
+_STOPPED = ServerState.STOPPED
+_RUNNING = ServerState.RUNNING
+_PORT_CONFLICT = ServerState.PORT_CONFLICT
+
 
 def find_process_on_port(port: int) -> psutil.Process | None:
     """find process listening on the given port; returns the Process object if found (else None)"""
+    if sys.platform.startswith("linux"):
+        # one pass over the kernel socket tables instead of one per process
+        try:
+            pid = find_pid_on_port(port)
+        except OSError:
+            pass  # no /proc; fall through to psutil
+        else:
+            if pid is None:
+                return None
+            try:
+                return psutil.Process(pid)
+            except psutil.NoSuchProcess:
+                return None
+
+    # elsewhere, macOS included, psutil is already lsof-free: it reads each process's
+    # sockets in-process (libproc's proc_pidinfo on macOS), with no subprocess to drop
     for proc in psutil.process_iter():
         try:
             for conn in proc.net_connections(kind="inet"):
@@ -25,13 +51,44 @@ def find_process_on_port(port: int) -> psutil.Process | None:
     return None
 
 
+# is_specbook_process results by (pid, create_time); create_time guards against pid
+# reuse, and unreadable processes are never cached
+_specbook_process_cache: dict[tuple[int, float], bool] = {}
+_SPECBOOK_PROCESS_CACHE_SIZE = 128
+
+
 def is_specbook_process(proc: psutil.Process) -> bool:
     """check if process is a specbook server"""
+    try:
+        key = (proc.pid, proc.create_time())
+    except psutil.Error:
+        return bool(_cmdline_mentions_specbook(proc))
+    cached = _specbook_process_cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = _cmdline_mentions_specbook(proc)
+    if result is None:
+        return False
+    if len(_specbook_process_cache) >= _SPECBOOK_PROCESS_CACHE_SIZE:
+        _specbook_process_cache.clear()
+    _specbook_process_cache[key] = result
+    return result
+
+
+def _cmdline_mentions_specbook(proc: psutil.Process) -> bool | None:
+    """whether proc's command line mentions specbook; None if it can't be read"""
+    if sys.platform.startswith("linux"):
+        # one read and a bytes search, no per-argument list of str
+        try:
+            return b"specbook" in read_cmdline(proc.pid)
+        except OSError:
+            pass  # gone or unreadable; let psutil decide
     try:
         cmdline = " ".join(proc.cmdline())
         return "specbook" in cmdline  # look for 'specbook' in the argument
     except (psutil.NoSuchProcess, psutil.AccessDenied):
-        return False
+        return None
 
 
 def get_project_root_from_process(proc: psutil.Process) -> Path | None:
@@ -43,13 +100,45 @@ def get_project_root_from_process(proc: psutil.Process) -> Path | None:
             if arg == "--project-root" and i + 1 < len(cmdline):
                 return Path(cmdline[i + 1])
         # fallback: check if last arg is a valid path
-        if cmdline and Path(cmdline[-1]).is_dir():
+        if cmdline and os.path.isdir(cmdline[-1]):
             return Path(cmdline[-1])
     except (psutil.NoSuchProcess, psutil.AccessDenied):
         pass
     return None
 
 
+# how long a get_server_status result is reused (seconds); finding the process on a
+# port walks every socket on the system, so back-to-back checks share one scan
+_STATUS_TTL = 0.5
+
+# recent statuses by port: (monotonic timestamp, status, listening process create_time)
+_status_cache: dict[int, tuple[float, ServerStatus, float | None]] = {}
+
+
+def _clear_status_cache() -> None:
+    """forget all cached server statuses (and specbook process checks)"""
+    _status_cache.clear()
+    _specbook_process_cache.clear()
+
+
+def _cached_status(port: int) -> ServerStatus | None:
+    """cached status for port, if still fresh and its process hasn't been replaced"""
+    cached = _status_cache.get(port)
+    if cached is None:
+        return None
+    timestamp, status, create_time = cached
+    if time.monotonic() - timestamp >= _STATUS_TTL:
+        return None
+    if status.pid is not None:
+        # a pid reused by a new process has a different create_time
+        try:
+            if psutil.Process(status.pid).create_time() != create_time:
+                return None
+        except psutil.Error:
+            return None
+    return status
+
+
 def get_server_status(port: int) -> ServerStatus:
     """Get the status of a server on a specific port.
 
@@ -57,13 +146,32 @@ def get_server_status(port: int) -> ServerStatus:
         - RUNNING: specbook server is active on the port
         - STOPPED: no process is listening on the port
         - PORT_CONFLICT: non-specbook process is using the port
+
+    Results are reused for up to _STATUS_TTL seconds while the listening process is
+    unchanged; start_server and stop_server drop the cached entry for their port.
     """
+    status = _cached_status(port)
+    if status is not None:
+        return status
+
     proc = find_process_on_port(port)
+    status = _status_for_process(port, proc)
+    create_time = None
+    if proc is not None:
+        try:
+            create_time = proc.create_time()
+        except psutil.Error:
+            return status
+    _status_cache[port] = (time.monotonic(), status, create_time)
+    return status
+
 
+def _status_for_process(port: int, proc: psutil.Process | None) -> ServerStatus:
+    """classify the process (if any) listening on port"""
     if proc is None:
         return ServerStatus(
             port=port,
-            state=ServerState.STOPPED,
+            state=_STOPPED,
             pid=None,
             project_root=None,
         )
@@ -72,7 +180,7 @@ def get_server_status(port: int) -> ServerStatus:
         project_root = get_project_root_from_process(proc)
         return ServerStatus(
             port=port,
-            state=ServerState.RUNNING,
+            state=_RUNNING,
             pid=proc.pid,
             project_root=project_root,
         )
@@ -80,7 +188,7 @@ def get_server_status(port: int) -> ServerStatus:
     # some other process is using the port
     return ServerStatus(
         port=port,
-        state=ServerState.PORT_CONFLICT,
+        state=_PORT_CONFLICT,
         pid=proc.pid,
         project_root=None,
     )
@@ -107,6 +215,7 @@ def start_server(config: ServerConfig) -> int:  # pragma: no cover
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
     )
+    _status_cache.pop(config.port, None)
 
     # give the server a moment to start
     time.sleep(0.5)
@@ -129,6 +238,7 @@ def stop_server(port: int) -> bool:  # pragma: no cover
     if not is_specbook_process(proc):
         return False
 
+    _status_cache.pop(port, None)
     try:
         proc.terminate()
         proc.wait(timeout=5)
@@ -151,7 +261,12 @@ def open_browser(url: str) -> bool:
     Returns:
         True if browser was launched successfully
     """
+    # imported on first use: webbrowser probes for installed browsers at import,
+    # which every other command (and test) would otherwise pay for
+    import webbrowser
+
+    # only launch failures are swallowed; anything else is a bug and should surface
     try:
         return webbrowser.open(url)
-    except Exception:
+    except (OSError, webbrowser.Error):
         return False
@@ -1,15 +1,27 @@
 """Starlette web application for specbook spec viewer"""
 
+import codecs
+import hashlib
+import json
+import os
+import posixpath
 import re
 import sys
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from pathlib import Path
+from stat import S_ISDIR, S_ISREG
+from typing import Any
 
+import jinja2
 import yaml
-from markdown_it import MarkdownIt
-from mdit_py_plugins.tasklists import tasklists_plugin
 from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
 from starlette.requests import Request
-from starlette.responses import HTMLResponse, JSONResponse
+from starlette.responses import HTMLResponse, JSONResponse, Response
 from starlette.routing import Mount, Route
 from starlette.staticfiles import StaticFiles
 from starlette.templating import Jinja2Templates
@@ -18,27 +30,142 @@ from specbook.core.models import (
     CompletionStatus,
     ProjectDocument,
     ProjectListing,
+    SpecDirectory,
     SpecDirectoryExpanded,
     SpecDocument,
     SpecStatus,
 )
 
-# markdown renderer with tables, strikethrough, and task lists
-_md = MarkdownIt("commonmark").enable("table").enable("strikethrough").use(tasklists_plugin)
+# libyaml-backed loader is several times faster on small frontmatter blocks; pure
+# Python SafeLoader when PyYAML was built without libyaml
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader
+
+# API responses are encoded with orjson when installed (`specbook[fast]`), which is
+# several times faster on large raw/rendered document bodies than stdlib json
+_JSONResponse: type[JSONResponse]
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    _JSONResponse = JSONResponse
+else:
+
+    class _ORJSONResponse(JSONResponse):
+        """JSONResponse encoded with orjson"""
+
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(content)
+
+    _JSONResponse = _ORJSONResponse
 
 # regex to match YAML frontmatter (but doesn't validate YAML; see parse_frontmatter)
 _FRONTMATTER_PATTERN = re.compile(r"^\s*---\s*\n(.*?)\n---\s*\n", re.DOTALL)
 
+# regex for a single pass over markdown bytes: group 1 matches the "# " opening an h1
+# line, group 2 the state byte of a task checkbox (b" " when unchecked)
+_SCAN_PATTERN = re.compile(rb"^(# )|- \[([ xX])\]", re.MULTILINE)
+
+# regex for a single task list line: group 1 is the "- " prefix, group 2 the checkbox
+# state (" " when unchecked), group 3 the rest of the line
+_CHECKBOX_LINE_PATTERN = re.compile(r"^(\s*-\s*)\[([ xX])\](.*)$")
+
+
+@lru_cache(maxsize=1)
+def _get_md_render() -> Callable[[str], str]:
+    """build the markdown renderer (tables, strikethrough, task lists) on first use
+
+    uses the Rust-backed markdown-it-pyrs when installed (`specbook[fast]`), which
+    emits the same task list markup (task-list-item-checkbox) the UI relies on
+    """
+    try:
+        from markdown_it_pyrs import MarkdownIt as RustMarkdownIt  # type: ignore[import-not-found]
+    except ImportError:
+        from markdown_it import MarkdownIt
+        from mdit_py_plugins.tasklists import tasklists_plugin
+
+        md = MarkdownIt("commonmark").enable("table").enable("strikethrough")
+        return md.use(tasklists_plugin).render
+    return RustMarkdownIt("commonmark").enable_many(["table", "strikethrough", "tasklist"]).render
+
+
+def _match_frontmatter(content: str) -> re.Match[str] | None:
+    """match the frontmatter block at the start of content, if any
+
+    most documents open with a heading or text, so the regex only runs when the first
+    character could begin frontmatter (a dash or whitespace)
+    """
+    if not content or not (content[0] == "-" or content[0].isspace()):
+        return None
+    return _FRONTMATTER_PATTERN.match(content)
+
 
 def render_markdown(content: str) -> str:
     """render markdown content to HTML, excluding frontmatter"""
 
     # remove frontmatter when rendering view
-    match = _FRONTMATTER_PATTERN.match(content)
+    match = _match_frontmatter(content)
     if match:
         # define content as post-frontmatter
         content = content[match.end() :]
-    return _md.render(content)
+    return _get_md_render()(content)
+
+
+def scan_markdown(data: bytes) -> tuple[str | None, int, int]:
+    """scan raw markdown once for its title and task checkboxes
+
+    returns (text of the first line starting with '# ' or None, checked, unchecked);
+    the patterns are ASCII, so the buffer is never decoded as a whole
+    """
+    title = None
+    checked = unchecked = 0
+    for match in _SCAN_PATTERN.finditer(data):
+        state = match.group(2)
+        if state is None:
+            # only "# " is consumed, so checkboxes later on the same line still count
+            if title is None:
+                start = match.end()
+                end = data.find(b"\n", start)
+                line = data[start : end if end != -1 else len(data)]
+                title = line.decode("utf-8", errors="replace").strip()
+        elif state == b" ":
+            unchecked += 1
+        else:
+            checked += 1
+    return title, checked, unchecked
+
+
+# frontmatter sits at the top of a document, so get_doc_status reads only this many
+# bytes unless the frontmatter block runs past them
+_FRONTMATTER_READ_SIZE = 4096
+
+# regex for a plain top-level `status: value` frontmatter line (value optionally quoted,
+# optionally followed by a comment); it only covers values YAML would read back as the
+# same string, and anything else is left to the YAML parser
+_STATUS_LINE_PATTERN = re.compile(
+    r"^status[ \t]*:[ \t]+(['\"]?)([A-Za-z][\w-]*)\1(?:[ \t]+(?:#.*)?)?$",
+    re.MULTILINE | re.IGNORECASE,
+)
+# an indented line after the status line would continue its value
+_CONTINUATION_PATTERN = re.compile(r"\n(?:[ \t]*\n)*[ \t]")
+# plain scalars YAML resolves to booleans or null rather than strings
+_YAML_NON_STRING_WORDS = frozenset({"null", "true", "false", "yes", "no", "on", "off"})
+
+
+def _scan_status_line(block: str) -> str | None:
+    """status value from a frontmatter block without a YAML parse, or None when the
+    block can't be read that way (no status line, duplicates, or unusual values)"""
+    matches = list(_STATUS_LINE_PATTERN.finditer(block))
+    if len(matches) != 1:
+        return None
+    match = matches[0]
+    quote, value = match.group(1), match.group(2)
+    if not quote and value.lower() in _YAML_NON_STRING_WORDS:
+        return None
+    if _CONTINUATION_PATTERN.match(block, match.end()):
+        return None
+    return value
 
 
 def parse_frontmatter(content: str) -> dict:
@@ -47,11 +174,11 @@ def parse_frontmatter(content: str) -> dict:
 
     returns empty dict if frontmatter cannot be parsed
     """
-    match = _FRONTMATTER_PATTERN.match(content)
+    match = _match_frontmatter(content)
     if not match:
         return {}
     try:
-        result = yaml.safe_load(match.group(1))
+        result = yaml.load(match.group(1), Loader=_YamlLoader)
         if not isinstance(result, dict):
             return {}
         # normalize keys to lowercase for case-insensitivity
@@ -67,23 +194,42 @@ def get_doc_status(doc_path: Path) -> SpecStatus:
     returns SpecStatus.UNKNOWN if status value is not recognized
     TODO: return other statuses based on doc analysis (e.g. tasks completed)
     """
-    if not doc_path.is_file():
-        return SpecStatus.DRAFT
-
+    # missing files and directories raise OSError, so no separate is_file() stat
     try:
-        content = doc_path.read_text(encoding="utf-8")
-        frontmatter = parse_frontmatter(content)
-        status_value = frontmatter.get("status")
-        return SpecStatus.from_string(status_value)
+        with open(doc_path, "rb") as f:
+            data = f.read(_FRONTMATTER_READ_SIZE)
+            at_eof = len(data) < _FRONTMATTER_READ_SIZE
+            # incremental decoder holds back a multi-byte character cut off by the read
+            content = codecs.getincrementaldecoder("utf-8")().decode(data, final=at_eof)
+            if not at_eof and not _match_frontmatter(content):
+                # only a frontmatter block longer than the prefix is worth a full read
+                head = content.lstrip()
+                if not head or head.startswith("---"):
+                    content = (data + f.read()).decode("utf-8")
     except OSError:
         return SpecStatus.DRAFT
+    match = _match_frontmatter(content)
+    if match is None:
+        return SpecStatus.DRAFT
+    status_value = _scan_status_line(match.group(1))
+    if status_value is None:
+        status_value = parse_frontmatter(content).get("status")
+    return SpecStatus.from_string(status_value)
 
 
 # templates and static dir relative to this file
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 STATIC_DIR = Path(__file__).parent / "static"
 DOCS_DIR = STATIC_DIR / "docs"
-templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+# templates ship with the package and don't change under a running server, so skip
+# the per-render up-to-date check on the template source
+templates = Jinja2Templates(
+    env=jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATES_DIR),
+        autoescape=jinja2.select_autoescape(),
+        auto_reload=False,
+    )
+)
 
 # document type display name mapping
 _DOCUMENT_TYPE_MAP: dict[str, tuple[str, str, int]] = {
@@ -124,120 +270,367 @@ _PROJECT_DOC_LOCATIONS: list[tuple[str, str]] = [
 ]
 
 
+@lru_cache(maxsize=8)
+def _project_doc_locations(project_root: Path) -> tuple[tuple[Path, str], ...]:
+    """absolute (path, category) pairs for _PROJECT_DOC_LOCATIONS under project_root
+
+    cached, since the project root is fixed for the life of the server
+    """
+    return tuple(
+        (project_root / location, category) for location, category in _PROJECT_DOC_LOCATIONS
+    )
+
+
+@lru_cache(maxsize=1024)
 def _get_document_info(filename: str) -> tuple[str, str, int]:
-    """get display name, doc type, and sort order for a filename"""
-    if filename in _DOCUMENT_TYPE_MAP:
-        return _DOCUMENT_TYPE_MAP[filename]
+    """get display name, doc type, and sort order for a filename
+
+    cached, since the same filenames recur across every spec in a listing
+    """
+    info = _DOCUMENT_TYPE_MAP.get(filename)
+    if info is not None:
+        return info
     # other markdown files: use filename without extension
-    display_name = filename[:-3] if filename.endswith(".md") else filename
+    display_name = filename[:-3] if filename[-3:] == ".md" else filename
     return (display_name.replace("-", " ").replace("_", " ").title(), "other", 999)
 
 
-def _parse_completion_status(tasks_path: Path) -> CompletionStatus:
-    """parse tasks.md to determine completion status based on checkboxes"""
-    if not tasks_path.is_file():
-        return CompletionStatus(total_tasks=0, completed_tasks=0)
+def _parse_completion_status(source: Path | str) -> CompletionStatus:
+    """parse tasks.md (a path, or its already-read text) for checkbox completion status"""
+    if isinstance(source, str):
+        data = source.encode()
+    else:
+        # a missing tasks.md raises OSError, so no separate is_file() stat
+        try:
+            # the pattern is ASCII, so match on raw bytes and skip UTF-8 decoding
+            data = source.read_bytes()
+        except OSError:
+            return CompletionStatus(total_tasks=0, completed_tasks=0)
+
+    # count checked and unchecked items in a single pass
+    _, checked, unchecked = scan_markdown(data)
+    return CompletionStatus(
+        total_tasks=checked + unchecked,
+        completed_tasks=checked,
+    )
+
+
+# per-file scan results persisted across server restarts, so a warm start reads one
+# JSON file instead of every document: absolute path -> {"mtime_ns", "size", and the
+# "status" and/or "tasks" found}; an entry is only used while mtime and size match
+_SCAN_STORE_VERSION = 2
+_scan_store: dict[str, dict] = {}
+_scan_store_seen: set[str] = set()
+_scan_store_file: Path | None = None
+_scan_store_dirty = False
+_scan_store_lock = threading.Lock()
+
+
+def _scan_store_path(project_root: Path) -> Path | None:
+    """scan store file for project_root, under the user cache dir (not the project);
+    None when there is no cache dir to use (no XDG_CACHE_HOME and no home dir)"""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if not cache_home:
+        try:
+            cache_home = Path.home() / ".cache"
+        except (RuntimeError, OSError, KeyError):
+            return None
+    digest = hashlib.sha256(os.fsencode(project_root)).hexdigest()[:16]
+    return Path(cache_home) / "specbook" / f"scan-{digest}.json"
+
+
+def _is_int(value: object) -> bool:
+    """true for a JSON integer (bool is an int subclass, but not one)"""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _valid_scan_entry(entry: object) -> bool:
+    """true if a persisted scan store entry has the shape _store_scan writes"""
+    if not isinstance(entry, dict):
+        return False
+    if not (_is_int(entry.get("mtime_ns")) and _is_int(entry.get("size"))):
+        return False
+    if "status" in entry and not isinstance(entry["status"], str):
+        return False
+    if "tasks" in entry:
+        tasks = entry["tasks"]
+        if not (isinstance(tasks, list) and len(tasks) == 2 and all(map(_is_int, tasks))):
+            return False
+    return True
+
+
+def _load_scan_store(project_root: Path) -> None:
+    """load persisted scan results for project_root; a missing or bad file is ignored,
+    as are malformed entries in an otherwise readable one"""
+    global _scan_store_file, _scan_store_dirty
+    with _scan_store_lock:
+        _scan_store.clear()
+        _scan_store_seen.clear()
+        _scan_store_dirty = False
+        _scan_store_file = _scan_store_path(project_root)
+        if _scan_store_file is None:
+            return  # no store; scan results are only kept in memory
+        try:
+            data = json.loads(_scan_store_file.read_bytes())
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == _SCAN_STORE_VERSION:
+            files = data.get("files")
+            if isinstance(files, dict):
+                _scan_store.update(
+                    (path, entry) for path, entry in files.items() if _valid_scan_entry(entry)
+                )
+
+
+def _save_scan_store() -> None:
+    """write the scan store back when it changed, dropping entries not seen since load
 
+    failures are ignored; they only cost the next start a full scan
+    """
+    global _scan_store_dirty
+    with _scan_store_lock:
+        if _scan_store_file is None:
+            return
+        files = {path: _scan_store[path] for path in _scan_store_seen if path in _scan_store}
+        if not _scan_store_dirty and len(files) == len(_scan_store):
+            return
+        _scan_store_dirty = False
+        payload = json.dumps({"version": _SCAN_STORE_VERSION, "files": files})
+        tmp_file = _scan_store_file.with_name(f"{_scan_store_file.name}.{os.getpid()}.tmp")
+        try:
+            _scan_store_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(payload, encoding="utf-8")
+            os.replace(tmp_file, _scan_store_file)
+        except OSError:
+            tmp_file.unlink(missing_ok=True)
+
+
+# API writes so far, in total and per document (normalized path). a same-size edit
+# (e.g. a checkbox toggle) within one mtime tick leaves (mtime, size) unchanged, so
+# every cache key and etag derived from a document also carries its write count.
+# counts are bumped only once a write has completed: a reader that saw the new count
+# reads the new bytes, and whatever a slower reader caches under the old count is
+# never asked for again
+_write_generation = 0
+_document_generations: dict[str, int] = {}
+
+
+def _document_generation(path: str) -> int:
+    """number of completed API writes to path (0 if the API never wrote it)"""
+    if not _document_generations:
+        return 0
+    return _document_generations.get(os.path.normpath(path), 0)
+
+
+def _record_write(path: Path) -> None:
+    """count a completed API write to path, retiring results cached from its old bytes"""
+    global _write_generation
+    key = os.path.normpath(path)
+    with _scan_store_lock:
+        _write_generation += 1
+        _document_generations[key] = _document_generations.get(key, 0) + 1
+        _scan_store.pop(key, None)
+
+
+def _stored_scan(path: str, mtime_ns: int, size: int, key: str) -> object:
+    """persisted scan value for path if the file is unchanged, else None"""
+    # under the lock: concurrent spec scans add to _scan_store_seen while
+    # _save_scan_store iterates it
+    with _scan_store_lock:
+        entry = _scan_store.get(path)
+        if entry is None or entry.get("mtime_ns") != mtime_ns or entry.get("size") != size:
+            return None
+        _scan_store_seen.add(path)
+        return entry.get(key)
+
+
+def _store_scan(
+    path: str, mtime_ns: int, size: int, generation: int, key: str, value: object
+) -> None:
+    """record a scan value for path at (mtime, size), read at write count generation"""
+    global _scan_store_dirty
+    with _scan_store_lock:
+        if _document_generation(path) != generation:
+            return  # written since this scan read it; the value may be stale
+        entry = _scan_store.get(path)
+        if entry is None or entry.get("mtime_ns") != mtime_ns or entry.get("size") != size:
+            entry = _scan_store[path] = {"mtime_ns": mtime_ns, "size": size}
+        entry[key] = value
+        _scan_store_seen.add(path)
+        _scan_store_dirty = True
+
+
+@lru_cache(maxsize=4096)
+def _cached_doc_status(path: str, mtime_ns: int, size: int, generation: int) -> SpecStatus:
+    """get_doc_status memoized on (path, mtime, size, write count), so listing
+    rebuilds only re-read documents that actually changed"""
+    stored = _stored_scan(path, mtime_ns, size, "status")
+    if isinstance(stored, str):
+        return SpecStatus.from_string(stored)
+    status = get_doc_status(Path(path))
+    _store_scan(path, mtime_ns, size, generation, "status", status.value)
+    return status
+
+
+@lru_cache(maxsize=1024)
+def _cached_completion_status(
+    path: str, mtime_ns: int, size: int, generation: int
+) -> CompletionStatus:
+    """_parse_completion_status memoized on (path, mtime, size, write count)"""
+    stored = _stored_scan(path, mtime_ns, size, "tasks")
+    if isinstance(stored, list) and len(stored) == 2:
+        return CompletionStatus(total_tasks=stored[0], completed_tasks=stored[1])
+    completion = _parse_completion_status(Path(path))
+    tasks = [completion.total_tasks, completion.completed_tasks]
+    _store_scan(path, mtime_ns, size, generation, "tasks", tasks)
+    return completion
+
+
+def _entry_doc_status(entry: os.DirEntry[str]) -> SpecStatus:
+    """status of a scanned markdown file, via the per-file cache"""
+    generation = _document_generation(entry.path)  # before the file is read
     try:
-        content = tasks_path.read_text(encoding="utf-8")
-        # count checked and unchecked items
-        checked = len(re.findall(r"- \[[xX]\]", content))
-        unchecked = len(re.findall(r"- \[ \]", content))
-        return CompletionStatus(
-            total_tasks=checked + unchecked,
-            completed_tasks=checked,
-        )
+        st = entry.stat()
+    except OSError:
+        return SpecStatus.DRAFT
+    return _cached_doc_status(entry.path, st.st_mtime_ns, st.st_size, generation)
+
+
+def _entry_completion_status(entry: os.DirEntry[str]) -> CompletionStatus:
+    """completion status of a scanned tasks.md, via the per-file cache"""
+    generation = _document_generation(entry.path)  # before the file is read
+    try:
+        st = entry.stat()
     except OSError:
         return CompletionStatus(total_tasks=0, completed_tasks=0)
+    return _cached_completion_status(entry.path, st.st_mtime_ns, st.st_size, generation)
 
 
 def _scan_spec_documents(spec_dir: Path) -> list[SpecDocument]:
     """scan a spec directory for all markdown documents"""
-    if not spec_dir.is_dir():
-        return []
-
-    docs = []
-    for f in spec_dir.iterdir():
-        if f.is_file() and f.suffix == ".md":
-            display_name, doc_type, _ = _get_document_info(f.name)
-            status = get_doc_status(f)
-            docs.append(
-                SpecDocument(
-                    name=f.name,
-                    path=f,
-                    display_name=display_name,
-                    doc_type=doc_type,
-                    status=status,
-                )
-            )
+    return _scan_spec_dir(spec_dir)[0]
 
-    # also scan subdirectories for contracts etc.
-    for subdir in spec_dir.iterdir():
-        if subdir.is_dir() and not subdir.name.startswith("."):
-            for f in subdir.iterdir():
-                if f.is_file() and f.suffix == ".md":
-                    # use subdir/filename format for display
-                    display_name = f"{subdir.name}/{f.stem}".title()
-                    status = get_doc_status(f)
-                    docs.append(
-                        SpecDocument(
-                            name=f"{subdir.name}/{f.name}",
-                            path=f,
+
+def _scan_spec_dir(spec_dir: Path) -> tuple[list[SpecDocument], CompletionStatus]:
+    """scan a spec directory for its markdown documents and tasks.md completion"""
+    # (sort_order, name, doc): sort keys are computed once per doc, not per comparison
+    docs: list[tuple[int, str, SpecDocument]] = []
+    subdirs: list[os.DirEntry[str]] = []
+    completion = CompletionStatus(total_tasks=0, completed_tasks=0)
+
+    # one scandir pass classifies files and subdirectories; entries carry the file
+    # type from readdir, so is_file()/is_dir() don't need an extra stat() per entry.
+    # work on DirEntry name/path strings; Path objects are only built for storage
+    try:
+        with os.scandir(spec_dir) as it:
+            for entry in it:
+                if entry.is_file():
+                    if entry.name.endswith(".md"):
+                        display_name, doc_type, order = _get_document_info(entry.name)
+                        doc = SpecDocument(
+                            name=entry.name,
+                            path=Path(entry.path),
                             display_name=display_name,
-                            doc_type="other",
-                            status=status,
+                            doc_type=doc_type,
+                            status=_entry_doc_status(entry),
                         )
+                        docs.append((order, doc.name, doc))
+                        if entry.name == "tasks.md":
+                            # the DirEntry caches the stat() taken for the doc status
+                            completion = _entry_completion_status(entry)
+                elif entry.is_dir() and not entry.name.startswith("."):
+                    subdirs.append(entry)
+    except (FileNotFoundError, NotADirectoryError):
+        return [], completion
+
+    # also scan subdirectories for contracts etc.
+    for subdir in subdirs:
+        with os.scandir(subdir.path) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(".md"):
+                    # use subdir/filename format for display
+                    name = f"{subdir.name}/{entry.name}"
+                    display_name = f"{subdir.name}/{entry.name[:-3]}".title()
+                    _, _, order = _get_document_info(name)
+                    doc = SpecDocument(
+                        name=name,
+                        path=Path(entry.path),
+                        display_name=display_name,
+                        doc_type="other",
+                        status=_entry_doc_status(entry),
                     )
+                    docs.append((order, name, doc))
 
     # sort by known type order, then alphabetically
-    def sort_key(doc: SpecDocument) -> tuple[int, str]:
-        _, _, order = _get_document_info(doc.name)
-        return (order, doc.name)
-
-    return sorted(docs, key=sort_key)
+    docs.sort(key=itemgetter(0, 1))
+    return [doc for _, _, doc in docs], completion
 
 
 def _discover_project_documents(project_root: Path) -> list[ProjectDocument]:
     """discover project-level documents from configured locations"""
-    docs: list[ProjectDocument] = []
+    # (sort_order, display_name, doc): sort keys are computed once per doc
+    docs: list[tuple[int, str, ProjectDocument]] = []
     seen_files = set()
 
-    for location, category in _PROJECT_DOC_LOCATIONS:
-        location_path = project_root / location
+    for location_path, category in _project_doc_locations(project_root):
+        # one stat() tells us both whether the location exists and what it is
+        try:
+            mode = location_path.stat().st_mode
+        except OSError:
+            continue
 
         # handle single file locations (e.g., "CLAUDE.md")
-        if location_path.is_file():
+        if S_ISREG(mode):
             if location_path.name not in seen_files:
-                display_name, _, _ = _get_document_info(location_path.name)
-                docs.append(
-                    ProjectDocument(
-                        name=display_name,
-                        path=location_path,
-                        category=category,
-                    )
+                display_name, _, order = _get_document_info(location_path.name)
+                doc = ProjectDocument(
+                    name=display_name,
+                    path=location_path,
+                    category=category,
                 )
+                docs.append((order, display_name, doc))
                 seen_files.add(location_path.name)
 
         # handle directory locations (e.g., ".specify/memory/")
-        elif location_path.is_dir():
-            for f in sorted(location_path.iterdir()):
-                if f.is_file() and f.suffix == ".md" and f.name not in seen_files:
-                    display_name, _, _ = _get_document_info(f.name)
-                    docs.append(
-                        ProjectDocument(
-                            name=display_name,
-                            path=f,
-                            category=category,
-                        )
-                    )
-                    seen_files.add(f.name)
+        elif S_ISDIR(mode):
+            # filter while scanning so only new markdown files get sorted
+            with os.scandir(location_path) as it:
+                md_entries = [
+                    e
+                    for e in it
+                    if e.name.endswith(".md") and e.name not in seen_files and e.is_file()
+                ]
+            md_entries.sort(key=attrgetter("name"))
+            for entry in md_entries:
+                display_name, _, order = _get_document_info(entry.name)
+                doc = ProjectDocument(
+                    name=display_name,
+                    path=Path(entry.path),
+                    category=category,
+                )
+                docs.append((order, display_name, doc))
+                seen_files.add(entry.name)
 
     # sort by sort_order from document type map, then alphabetically
-    def sort_key(doc: ProjectDocument) -> tuple[int, str]:
-        _, _, order = _get_document_info(doc.path.name)
-        return (order, doc.name)
+    docs.sort(key=itemgetter(0, 1))
+    return [doc for _, _, doc in docs]
+
+
+def _scan_one_spec(spec_path: Path) -> SpecDirectoryExpanded:
+    """scan a single spec directory for its documents and completion status"""
+    # completion comes from the tasks.md entry found by the scan, so there is no path
+    # join or extra stat(), and no failed open() when the spec has no tasks.md
+    documents, completion = _scan_spec_dir(spec_path)
+    return SpecDirectoryExpanded(
+        name=spec_path.name,
+        path=spec_path,
+        documents=documents,
+        completion=completion,
+    )
+
 
-    return sorted(docs, key=sort_key)
+# upper bound on threads used to scan spec directories concurrently
+_MAX_SCAN_WORKERS = 16
 
 
 def _build_project_listing(project_root: Path) -> ProjectListing:
@@ -247,23 +640,26 @@ def _build_project_listing(project_root: Path) -> ProjectListing:
 
     # scan specs directory
     specs_dir = project_root / "specs"
-    specs: list[SpecDirectoryExpanded] = []
-
-    if specs_dir.is_dir():
-        for spec_path in sorted(specs_dir.iterdir()):
-            if spec_path.is_dir() and not spec_path.name.startswith("."):
-                documents = _scan_spec_documents(spec_path)
-                # parse completion status from tasks.md
-                tasks_path = spec_path / "tasks.md"
-                completion = _parse_completion_status(tasks_path)
-                specs.append(
-                    SpecDirectoryExpanded(
-                        name=spec_path.name,
-                        path=spec_path,
-                        documents=documents,
-                        completion=completion,
-                    )
-                )
+
+    try:
+        with os.scandir(specs_dir) as it:
+            entries = sorted(it, key=lambda e: SpecDirectory.sort_key(e.name))
+    except (FileNotFoundError, NotADirectoryError):
+        entries = []
+
+    spec_paths = [
+        Path(entry.path) for entry in entries if entry.is_dir() and not entry.name.startswith(".")
+    ]
+
+    # per-spec scans are independent and spend their time in stat/read syscalls
+    # (which release the GIL), so run them on a thread pool; map() keeps the order
+    specs: list[SpecDirectoryExpanded]
+    if len(spec_paths) > 1:
+        workers = min(_MAX_SCAN_WORKERS, len(spec_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            specs = list(executor.map(_scan_one_spec, spec_paths))
+    else:
+        specs = [_scan_one_spec(spec_path) for spec_path in spec_paths]
 
     return ProjectListing(
         project_root=project_root,
@@ -272,22 +668,88 @@ def _build_project_listing(project_root: Path) -> ProjectListing:
     )
 
 
-# global project root (set by create_app or main)
-_project_root: Path | None = None
+def _listing_signature(project_root: Path) -> tuple:
+    """fingerprint the files a project listing is built from, using stat() only
 
+    captures directory entries (specs/docs added, removed, or renamed) and the
+    mtime and size of every markdown file (in-place edits), without reading content
+    """
+    # taken before any stat: API writes that keep (mtime, size) still change it
+    sig: list[tuple] = [(_write_generation,)]
 
-async def index(request: Request) -> HTMLResponse:
-    """render the spec listing page"""
-    if _project_root is None:
-        return HTMLResponse("Server not configured", status_code=500)
+    def walk(path: str, depth: int) -> None:
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        sig.append((entry.path,))
+                        if depth > 0 and not entry.name.startswith("."):
+                            walk(entry.path, depth - 1)
+                    elif entry.name.endswith(".md"):
+                        # a dangling symlink fails here; record it and keep scanning
+                        # the rest of the directory
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            sig.append((entry.path, None))
+                            continue
+                        sig.append((entry.path, st.st_mtime_ns, st.st_size))
+        except OSError:
+            pass
+
+    # specs/<spec>/<subdir>/<doc>.md, mirroring _build_project_listing
+    walk(str(project_root / "specs"), 2)
+
+    for location_path, _ in _project_doc_locations(project_root):
+        try:
+            st = location_path.stat()
+        except OSError:
+            sig.append((str(location_path), None))
+            continue
+        if S_ISDIR(st.st_mode):
+            walk(str(location_path), 0)
+        else:
+            sig.append((str(location_path), st.st_mtime_ns, st.st_size))
 
-    listing = _build_project_listing(_project_root)
+    return tuple(sig)
+
+
+# cached listings keyed by project root: (signature, listing, template project docs)
+_listing_cache: dict[Path, tuple[tuple, ProjectListing, list[dict[str, str]]]] = {}
+
+# rendered index pages keyed by project root: (listing signature, html bytes, etag)
+_index_page_cache: dict[Path, tuple[tuple, bytes, str]] = {}
+
+
+def _clear_listing_cache() -> None:
+    """drop all cached project listings (and the index pages and per-file results
+    they were built from)"""
+    _listing_cache.clear()
+    _index_page_cache.clear()
+    _cached_doc_status.cache_clear()
+    _cached_completion_status.cache_clear()
+
+
+def _get_project_listing(
+    project_root: Path,
+) -> tuple[tuple, ProjectListing, list[dict[str, str]]]:
+    """return (signature, listing, template project docs) for project_root
+
+    the listing is only rebuilt when the stat() signature of the project changes,
+    so steady-state page loads skip reading and parsing every document
+    """
+    sig = _listing_signature(project_root)
+    cached = _listing_cache.get(project_root)
+    if cached is not None and cached[0] == sig:
+        return cached
+
+    listing = _build_project_listing(project_root)
 
     # compute relative paths for project documents
     project_docs_with_paths = []
     for doc in listing.project_documents:
         try:
-            rel_path = doc.path.relative_to(_project_root)
+            rel_path = doc.path.relative_to(project_root)
         except ValueError:
             rel_path = doc.path
         project_docs_with_paths.append(
@@ -298,22 +760,82 @@ async def index(request: Request) -> HTMLResponse:
             }
         )
 
-    return templates.TemplateResponse(
-        request,
-        "index.html",
-        {
-            "project_documents": project_docs_with_paths,
-            "specs": listing.specs,
-        },
-    )
+    entry = (sig, listing, project_docs_with_paths)
+    _listing_cache[project_root] = entry
+    _save_scan_store()
+    return entry
 
 
-def _is_safe_path(project_root: Path, requested_path: Path) -> bool:
-    """check if requested path is within project root (prevents directory traverse)"""
+# global project root (set by create_app or main)
+_project_root: Path | None = None
+# resolved once per app, since canonicalizing the root costs a syscall per component
+_project_root_resolved: Path | None = None
+
+
+def _get_index_page(project_root: Path) -> tuple[tuple, bytes, str]:
+    """return (listing signature, rendered index page, etag) for project_root"""
+    sig, listing, project_docs_with_paths = _get_project_listing(project_root)
+
+    # _get_project_listing hands back the cached signature object until the listing
+    # is rebuilt, so an identity check tells whether the rendered page is current
+    cached = _index_page_cache.get(project_root)
+    if cached is None or cached[0] is not sig:
+        html = templates.get_template("index.html").render(
+            project_documents=project_docs_with_paths,
+            specs=listing.specs,
+        )
+        # the signature changes whenever the listing does; hash() is salted per
+        # process, so a restarted server never revalidates against a stale page
+        etag = f'"{hash(sig) & 0xFFFFFFFFFFFFFFFF:016x}"'
+        cached = (sig, html.encode("utf-8"), etag)
+        _index_page_cache[project_root] = cached
+    return cached
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """true if the request's If-None-Match header lists etag (or *)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return etag in tags or "*" in tags
+
+
+def _not_modified(etag: str) -> Response:
+    """empty 304 response for a client that already has the current version"""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+async def index(request: Request) -> Response:
+    """render the spec listing page"""
+    if _project_root is None:
+        return HTMLResponse("Server not configured", status_code=500)
+
+    # the signature walk and any rebuild block on disk I/O; keep them off the event loop
+    _, page, etag = await run_in_threadpool(_get_index_page, _project_root)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    # no-cache: browsers must revalidate, which the etag makes cheap
+    return HTMLResponse(page, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+def _is_safe_path(project_root: Path, path_param: str) -> bool:
+    """check if path_param stays within project root (prevents directory traverse)
+
+    project_root must already be resolved (see create_app), so only the requested
+    path needs a resolve() — which is still required to catch escaping symlinks
+    """
+    # pure string checks reject obvious traversal before touching the filesystem
+    if "\x00" in path_param:
+        return False
+    norm = posixpath.normpath(path_param)
+    if norm == ".." or norm.startswith("../") or posixpath.isabs(norm) or os.path.isabs(norm):
+        return False
     try:
-        resolved = requested_path.resolve()
-        project_resolved = project_root.resolve()
-        return resolved.is_relative_to(project_resolved)
+        # resolve the path as the handlers will open it, not the normalized string:
+        # "link/../x.md" goes through link's target before the "..", while normpath
+        # would collapse it lexically to "x.md"
+        return (project_root / path_param).resolve().is_relative_to(project_root)
     except (ValueError, OSError):
         return False
 
@@ -323,18 +845,18 @@ def _validate_document_path(path_param: str | None) -> tuple[Path | None, JSONRe
 
     Returns (full_path, None) on success, or (None, error_response) on failure.
     """
-    if _project_root is None:
-        return None, JSONResponse({"error": "Server not configured"}, status_code=500)
+    if _project_root is None or _project_root_resolved is None:
+        return None, _JSONResponse({"error": "Server not configured"}, status_code=500)
 
     if not path_param:
-        return None, JSONResponse(
+        return None, _JSONResponse(
             {"error": "Invalid path", "detail": "Missing path parameter"},
             status_code=400,
         )
 
     # only allow .md files
     if not path_param.endswith(".md"):
-        return None, JSONResponse(
+        return None, _JSONResponse(
             {"error": "Invalid path", "detail": "Only markdown files allowed"},
             status_code=400,
         )
@@ -343,8 +865,8 @@ def _validate_document_path(path_param: str | None) -> tuple[Path | None, JSONRe
     full_path = _project_root / path_param
 
     # security: check path is within project root
-    if not _is_safe_path(_project_root, full_path):
-        return None, JSONResponse(
+    if not _is_safe_path(_project_root_resolved, path_param):
+        return None, _JSONResponse(
             {"error": "Invalid path", "detail": "Path outside project root"},
             status_code=400,
         )
@@ -352,7 +874,26 @@ def _validate_document_path(path_param: str | None) -> tuple[Path | None, JSONRe
     return full_path, None
 
 
-async def api_document(request: Request) -> JSONResponse:
+@lru_cache(maxsize=256)
+def _render_document(
+    path: str, mtime_ns: int, size: int, generation: int
+) -> tuple[str, str, CompletionStatus]:
+    """read and render the doc at path, returning (title, html, task completion)
+
+    mtime_ns, size and generation (API write count) are only part of the cache key:
+    an edited file gets a new key, so repeat views of unchanged docs skip both the
+    read and the render
+    """
+    doc_path = Path(path)
+    data = doc_path.read_bytes()
+    # title from first h1 (or filename) and checkbox counts in one pass
+    title, checked, unchecked = scan_markdown(data)
+    completion = CompletionStatus(total_tasks=checked + unchecked, completed_tasks=checked)
+    html = render_markdown(data.decode("utf-8"))
+    return title if title is not None else doc_path.stem, html, completion
+
+
+async def api_document(request: Request) -> Response:
     """fetch and render a markdown doc"""
     path_param = request.query_params.get("path")
     full_path, error = _validate_document_path(path_param)
@@ -361,45 +902,53 @@ async def api_document(request: Request) -> JSONResponse:
 
     assert full_path is not None  # for type checks
 
-    # check if file exists
-    if not full_path.is_file():
-        return JSONResponse(
+    # taken before the file is read, so a concurrent API write can't pair the new
+    # count with old bytes
+    generation = _document_generation(str(full_path))
+
+    # a single stat serves as existence check, render cache key, and timestamps;
+    # disk I/O and rendering run in the threadpool so other requests aren't stalled
+    try:
+        stat = await run_in_threadpool(full_path.stat)
+    except OSError:
+        stat = None
+    if stat is None or not S_ISREG(stat.st_mode):
+        return _JSONResponse(
             {"error": "Document not found", "path": path_param},
             status_code=404,
         )
 
-    # read and render
+    # unchanged since the client's copy: skip the read and render entirely
+    etag = f'"{generation}-{stat.st_mtime_ns}-{stat.st_size}"'
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+
+    # read and render (or reuse the render of an unchanged file)
     try:
-        content = full_path.read_text(encoding="utf-8")
-        html = render_markdown(content)
-        # extract title from first h1 or use filename
-        title = full_path.stem
-        lines = content.split("\n")
-        for line in lines:
-            if line.startswith("# "):
-                title = line[2:].strip()
-                break
-
-        # get file timestamps
-        stat = full_path.stat()
-        modified_ts = stat.st_mtime
-        created_ts = stat.st_ctime
-
-        return JSONResponse(
-            {
-                "title": title,
-                "content": html,
-                "path": path_param,
-                "modified": modified_ts,
-                "created": created_ts,
-            }
+        title, html, completion = await run_in_threadpool(
+            _render_document, str(full_path), stat.st_mtime_ns, stat.st_size, generation
         )
     except OSError:
-        return JSONResponse(
+        return _JSONResponse(
             {"error": "Document not found", "path": path_param},
             status_code=404,
         )
 
+    return _JSONResponse(
+        {
+            "title": title,
+            "content": html,
+            "path": path_param,
+            "modified": stat.st_mtime,
+            "created": stat.st_ctime,
+            "tasks": {
+                "total": completion.total_tasks,
+                "completed": completion.completed_tasks,
+            },
+        },
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
 
 async def api_document_raw(request: Request) -> JSONResponse:
     """fetch raw markdown content for editing"""
@@ -410,16 +959,16 @@ async def api_document_raw(request: Request) -> JSONResponse:
 
     assert full_path is not None
 
-    if not full_path.is_file():
-        return JSONResponse(
+    if not await run_in_threadpool(full_path.is_file):
+        return _JSONResponse(
             {"error": "Document not found", "path": path_param},
             status_code=404,
         )
 
     try:
-        content = full_path.read_text(encoding="utf-8")
-        stat = full_path.stat()
-        return JSONResponse(
+        content = await run_in_threadpool(full_path.read_text, encoding="utf-8")
+        stat = await run_in_threadpool(full_path.stat)
+        return _JSONResponse(
             {
                 "path": path_param,
                 "raw": content,
@@ -427,21 +976,98 @@ async def api_document_raw(request: Request) -> JSONResponse:
             }
         )
     except OSError:
-        return JSONResponse(
+        return _JSONResponse(
             {"error": "Document not found", "path": path_param},
             status_code=404,
         )
 
 
+# one lock per document, so saves and checkbox toggles (read, splice, write) running
+# in different threadpool workers never interleave on the same file
+_document_locks: dict[str, threading.Lock] = {}
+_document_locks_guard = threading.Lock()
+
+
+def _document_lock(path: Path) -> threading.Lock:
+    """the lock serializing API writes to path"""
+    key = os.path.normpath(path)
+    with _document_locks_guard:
+        lock = _document_locks.get(key)
+        if lock is None:
+            lock = _document_locks[key] = threading.Lock()
+        return lock
+
+
+def _write_document(path: Path, content: str) -> float:
+    """write content to path and return its new mtime, taken from the open file"""
+    with _document_lock(path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            modified = os.fstat(f.fileno()).st_mtime
+        _record_write(path)
+        return modified
+
+
+def _toggle_checkbox(path: Path, line_number: int, checked: bool) -> JSONResponse | None:
+    """set the checkbox on line_number (1-indexed) of path to checked
+
+    the read, splice and write happen under the document's lock, so a concurrent
+    toggle or save can't be lost; returns an error response if the line is invalid
+    """
+    with _document_lock(path):
+        content = path.read_text(encoding="utf-8")
+
+        # locate the line by offsets, validating it is in range
+        start = 0
+        for _ in range(line_number - 1):
+            newline = content.find("\n", start)
+            if newline < 0:
+                return _JSONResponse(
+                    {
+                        "error": "Invalid line number",
+                        "detail": f"Line {line_number} exceeds file length",
+                    },
+                    status_code=400,
+                )
+            start = newline + 1
+        end = content.find("\n", start)
+        if end < 0:
+            end = len(content)
+        line = content[start:end]
+
+        # check if line contains checkbox
+        checkbox = _CHECKBOX_LINE_PATTERN.match(line)
+
+        if not checkbox:
+            return _JSONResponse(
+                {
+                    "error": "Invalid checkbox",
+                    "detail": f"Line {line_number} is not a checkbox item",
+                },
+                status_code=400,
+            )
+
+        # toggle the box (lines already in the requested state are left untouched)
+        if checked != (checkbox.group(2) != " "):
+            state = "x" if checked else " "
+            line = f"{checkbox.group(1)}[{state}]{checkbox.group(3)}"
+
+        # write back, splicing the line into the original content
+        path.write_text(content[:start] + line + content[end:], encoding="utf-8")
+        _record_write(path)
+        return None
+
+
 async def api_document_save(request: Request) -> JSONResponse:
     """save edited markdown content to file"""
     if _project_root is None:
-        return JSONResponse({"error": "Server not configured"}, status_code=500)
+        return _JSONResponse({"error": "Server not configured"}, status_code=500)
 
     try:
         body = await request.json()
     except Exception:
-        return JSONResponse(
+        return _JSONResponse(
             {"error": "Invalid request", "detail": "Invalid JSON body"},
             status_code=400,
         )
@@ -450,7 +1076,7 @@ async def api_document_save(request: Request) -> JSONResponse:
     content = body.get("content")
 
     if content is None:
-        return JSONResponse(
+        return _JSONResponse(
             {"error": "Invalid request", "detail": "Missing content field"},
             status_code=400,
         )
@@ -462,43 +1088,49 @@ async def api_document_save(request: Request) -> JSONResponse:
     assert full_path is not None
 
     # check if file exists
-    if not full_path.is_file():
-        return JSONResponse(
+    if not await run_in_threadpool(full_path.is_file):
+        return _JSONResponse(
             {"error": "Document not found", "path": path_param},
             status_code=404,
         )
 
     try:
-        full_path.write_text(content, encoding="utf-8")
-        stat = full_path.stat()
-        return JSONResponse(
+        modified = await run_in_threadpool(_write_document, full_path, content)
+        return _JSONResponse(
             {
                 "success": True,
                 "path": path_param,
-                "modified": stat.st_mtime,
+                "modified": modified,
             }
         )
     except PermissionError:
-        return JSONResponse(
+        return _JSONResponse(
             {"error": "Save failed", "detail": "Permission denied"},
             status_code=403,
         )
     except OSError as e:
-        return JSONResponse(
+        return _JSONResponse(
             {"error": "Save failed", "detail": str(e)},
             status_code=500,
         )
 
 
+async def api_document_endpoint(request: Request) -> Response:
+    """/api/document: GET renders a document, POST saves edited content"""
+    if request.method == "POST":
+        return await api_document_save(request)
+    return await api_document(request)
+
+
 async def api_checkbox_toggle(request: Request) -> JSONResponse:
     """toggle a checkbox on a particular line"""
     if _project_root is None:
-        return JSONResponse({"error": "Server not configured"}, status_code=500)
+        return _JSONResponse({"error": "Server not configured"}, status_code=500)
 
     try:
         body = await request.json()
     except Exception:
-        return JSONResponse(
+        return _JSONResponse(
             {"error": "Invalid request", "detail": "Invalid JSON body"},
             status_code=400,
         )
@@ -508,13 +1140,13 @@ async def api_checkbox_toggle(request: Request) -> JSONResponse:
     checked = body.get("checked")
 
     if line_number is None or not isinstance(line_number, int) or line_number < 1:
-        return JSONResponse(
+        return _JSONResponse(
             {"error": "Invalid line number", "detail": "lineNumber must be a positive integer"},
             status_code=400,
         )
 
     if checked is None or not isinstance(checked, bool):
-        return JSONResponse(
+        return _JSONResponse(
             {"error": "Invalid request", "detail": "checked must be a boolean"},
             status_code=400,
         )
@@ -525,58 +1157,18 @@ async def api_checkbox_toggle(request: Request) -> JSONResponse:
 
     assert full_path is not None
 
-    if not full_path.is_file():
-        return JSONResponse(
+    if not await run_in_threadpool(full_path.is_file):
+        return _JSONResponse(
             {"error": "Document not found", "path": path_param},
             status_code=404,
         )
 
     try:
-        content = full_path.read_text(encoding="utf-8")
-        lines = content.split("\n")
-
-        # validate line number is in range
-        if line_number > len(lines):
-            return JSONResponse(
-                {
-                    "error": "Invalid line number",
-                    "detail": f"Line {line_number} exceeds file length",
-                },
-                status_code=400,
-            )
-
-        # get the line (1-indexed)
-        line_idx = line_number - 1
-        line = lines[line_idx]
-
-        # check if line contains checkbox
-        checkbox_unchecked = re.match(r"^(\s*-\s*)\[ \](.*)$", line)
-        checkbox_checked = re.match(r"^(\s*-\s*)\[[xX]\](.*)$", line)
-
-        if not checkbox_unchecked and not checkbox_checked:
-            return JSONResponse(
-                {
-                    "error": "Invalid checkbox",
-                    "detail": f"Line {line_number} is not a checkbox item",
-                },
-                status_code=400,
-            )
-
-        # toggle the box
-        if checked:
-            # set to *checked*
-            if checkbox_unchecked:
-                lines[line_idx] = f"{checkbox_unchecked.group(1)}[x]{checkbox_unchecked.group(2)}"
-        else:
-            # set to *unchecked*
-            if checkbox_checked:
-                lines[line_idx] = f"{checkbox_checked.group(1)}[ ]{checkbox_checked.group(2)}"
-
-        # write back
-        new_content = "\n".join(lines)
-        full_path.write_text(new_content, encoding="utf-8")
+        error = await run_in_threadpool(_toggle_checkbox, full_path, line_number, checked)
+        if error:
+            return error
 
-        return JSONResponse(
+        return _JSONResponse(
             {
                 "success": True,
                 "path": path_param,
@@ -585,12 +1177,12 @@ async def api_checkbox_toggle(request: Request) -> JSONResponse:
             }
         )
     except PermissionError:
-        return JSONResponse(
+        return _JSONResponse(
             {"error": "Save failed", "detail": "Permission denied"},
             status_code=403,
         )
     except OSError as e:
-        return JSONResponse(
+        return _JSONResponse(
             {"error": "Save failed", "detail": str(e)},
             status_code=500,
         )
@@ -605,14 +1197,25 @@ def create_app(project_root: Path) -> Starlette:
     Returns:
         configured Starlette application
     """
-    global _project_root
+    _set_project_root(project_root)
+    return _build_app()
+
+
+def _set_project_root(project_root: Path) -> None:
+    """point the app's handlers at project_root, dropping state cached for the old one"""
+    global _project_root, _project_root_resolved
     _project_root = project_root
+    _project_root_resolved = project_root.resolve()
+    _clear_listing_cache()
+    _load_scan_store(_project_root_resolved)
+
 
+def _build_app() -> Starlette:
+    """the application's routes; handlers read the project root set by _set_project_root"""
     routes = [
         Route("/", index),
-        Route("/api/document", api_document),
+        Route("/api/document", api_document_endpoint, methods=["GET", "POST"]),
         Route("/api/document/raw", api_document_raw),
-        Route("/api/document", api_document_save, methods=["POST"]),
         Route("/api/checkbox", api_checkbox_toggle, methods=["POST"]),
         Mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static"),
     ]
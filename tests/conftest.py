@@ -1,15 +1,51 @@
 """Pytest fixtures for specbook tests."""
 
+import os
+import shutil
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
+from starlette.testclient import TestClient
+
+# RAM-backed temp root (Linux); tests are directory-heavy, so keep their trees off
+# disk where possible. elsewhere (macOS, Windows) the system temp dir is used as before
+_TMPFS_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """root tmp_path under tmpfs too, unless a temp root was chosen explicitly"""
+    if _TMPFS_ROOT is not None:
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", _TMPFS_ROOT)
+
+
+@pytest.fixture
+def isolated_cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """point the user cache dir (web UI scan store) at a per-test directory
+
+    web app test modules opt in with pytestmark, so other tests skip the setup
+    """
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
+@pytest.fixture
+def fresh_server_status() -> Iterator[None]:
+    """don't let a cached server status leak between tests (server test modules opt in
+    with pytestmark)"""
+    from specbook.core.server import _clear_status_cache
+
+    _clear_status_cache()
+    yield
+    _clear_status_cache()
 
 
 @pytest.fixture
 def temp_dir():
     """create temp directory for tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with tempfile.TemporaryDirectory(dir=_TMPFS_ROOT) as tmpdir:
         yield Path(tmpdir)
 
 
@@ -27,6 +63,31 @@ def project_with_specs(temp_dir: Path) -> Path:
     return temp_dir
 
 
+# a representative spec, built once per session and copied into projects that want it
+SAMPLE_SPEC_DOCUMENTS = {
+    "spec.md": "# Test Spec\n\nSome **bold** content.",
+    "plan.md": "# Implementation Plan\n\nDetails here.",
+    "tasks.md": "# Tasks\n\n- [ ] First task\n- [ ] Second task\n",
+}
+
+
+@pytest.fixture(scope="session")
+def sample_spec_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """specs/001-test/ holding SAMPLE_SPEC_DOCUMENTS, shared read-only by all tests"""
+    spec_dir = tmp_path_factory.mktemp("sample") / "specs" / "001-test"
+    spec_dir.mkdir(parents=True)
+    for name, content in SAMPLE_SPEC_DOCUMENTS.items():
+        (spec_dir / name).write_text(content)
+    return spec_dir.parent
+
+
+@pytest.fixture
+def project_with_sample_spec(project_with_specs: Path, sample_spec_tree: Path) -> Path:
+    """project_with_specs plus a writable copy of specs/001-test/ from sample_spec_tree"""
+    shutil.copytree(sample_spec_tree, project_with_specs / "specs", dirs_exist_ok=True)
+    return project_with_specs
+
+
 @pytest.fixture
 def project_with_both(temp_dir: Path) -> Path:
     """create typical spec-kit project with both .specify/ and specs/ directories"""
@@ -41,3 +102,23 @@ def nested_subdir(project_with_both: Path) -> Path:
     nested = project_with_both / "src" / "components" / "deep"
     nested.mkdir(parents=True)
     return nested
+
+
+@pytest.fixture(scope="module")
+def web_client() -> Iterator[TestClient]:
+    """one web app and TestClient per test module; see `client` for per-test setup"""
+    from specbook.ui.web.app import _build_app
+
+    # inside the context the client keeps one event loop portal (thread) open,
+    # instead of starting and joining one for every request
+    with TestClient(_build_app()) as client:
+        yield client
+
+
+@pytest.fixture
+def client(web_client: TestClient, project_with_specs: Path) -> TestClient:
+    """shared TestClient, pointed at this test's project_with_specs"""
+    from specbook.ui.web.app import _set_project_root
+
+    _set_project_root(project_with_specs)
+    return web_client
@@ -2,8 +2,12 @@
 
 from pathlib import Path
 
+import pytest
 from starlette.testclient import TestClient
 
+# keep the web app's scan store out of the real user cache dir
+pytestmark = pytest.mark.usefixtures("isolated_cache_home")
+
 
 class TestWebApp:
     """integration tests for the Starlette web app"""
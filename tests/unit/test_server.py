@@ -1,87 +1,140 @@
 """unit tests for server management utilities"""
 
+import os
+import shutil
+import socket
+import subprocess
+import sys
+from collections.abc import Sequence
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Any
 
-import psutil
+import pytest
 
+from specbook.core import server
+from specbook.core._proc_linux import find_pid_on_port
 from specbook.core.models import ServerState, SpecDirectory, SpecListing
 from specbook.core.server import (
+    AccessDenied,
     get_project_root_from_process,
     get_server_status,
     is_specbook_process,
     open_browser,
 )
 
+# get_server_status caches results per port; start each test without them
+pytestmark = pytest.mark.usefixtures("fresh_server_status")
+
+# spec directories created by spec_tree, alongside a hidden dir and a README file
+SPEC_TREE_DIRS = (
+    "002-feature-b",
+    "001-feature-a",
+    "003-feature-c",
+    "001-visible",
+    "002-also-visible",
+    "001-spec-dir",
+)
+
+
+@pytest.fixture(scope="session")
+def canonical_spec_tree(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """specs/ dir holding SPEC_TREE_DIRS plus a hidden dir and a file, built once"""
+    # plain string joins and os calls; no Path object per entry
+    specs_dir = os.path.join(tmp_path_factory.mktemp("canonical"), "specs")
+    os.mkdir(specs_dir)
+    for name in (*SPEC_TREE_DIRS, ".hidden"):
+        os.mkdir(os.path.join(specs_dir, name))
+    fd = os.open(os.path.join(specs_dir, "README.md"), os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+    try:
+        os.write(fd, b"readme")
+    finally:
+        os.close(fd)
+    return specs_dir
+
+
+@pytest.fixture
+def spec_tree(canonical_spec_tree: str, tmp_path: Path) -> Path:
+    """project whose specs/ is the shared canonical tree (read-only; don't modify)"""
+    try:
+        os.symlink(canonical_spec_tree, tmp_path / "specs", target_is_directory=True)
+    except OSError:
+        # no symlink support (e.g. unprivileged Windows): fall back to a copy
+        shutil.copytree(canonical_spec_tree, tmp_path / "specs")
+    return tmp_path
+
 
 class TestSpecListing:
     """tests for SpecListing.from_project()"""
 
-    def test_from_project_happy_path(self, temp_dir: Path) -> None:
-        """SpecListing.from_project() returns specs sorted by name"""
-        # create specs directory with subdirectories
-        specs_dir = temp_dir / "specs"
-        specs_dir.mkdir()
-        (specs_dir / "002-feature-b").mkdir()
-        (specs_dir / "001-feature-a").mkdir()
-        (specs_dir / "003-feature-c").mkdir()
-
-        listing = SpecListing.from_project(temp_dir)
-
-        assert listing.project_root == temp_dir
-        assert len(listing.specs) == 3
-        assert listing.specs[0].name == "001-feature-a"
-        assert listing.specs[1].name == "002-feature-b"
-        assert listing.specs[2].name == "003-feature-c"
+    def test_from_project_happy_path(self, spec_tree: Path) -> None:
+        """SpecListing.from_project() returns spec directories sorted by name"""
+        listing = SpecListing.from_project(spec_tree)
+
+        assert listing.project_root == spec_tree
+        assert [s.name for s in listing.specs] == sorted(SPEC_TREE_DIRS)
         assert not listing.is_empty
 
-    def test_from_project_empty_specs(self, temp_dir: Path) -> None:
+    @pytest.mark.parametrize(
+        "excluded",
+        [".hidden", "README.md"],
+        ids=["hidden-dirs", "files"],
+    )
+    def test_from_project_excludes(self, spec_tree: Path, excluded: str) -> None:
+        """SpecListing excludes hidden directories (starting with .) and files"""
+        listing = SpecListing.from_project(spec_tree)
+
+        assert excluded not in [s.name for s in listing.specs]
+
+    def test_from_project_inode_order(self, spec_tree: Path) -> None:
+        """SpecListing.from_project(sort="inode") returns specs in inode order"""
+        listing = SpecListing.from_project(spec_tree, sort="inode")
+        unsorted = SpecListing.from_project(spec_tree, sort=None)
+
+        inodes = [spec.path.stat().st_ino for spec in listing.specs]
+        assert inodes == sorted(inodes)
+        assert {spec.name for spec in unsorted.specs} == set(SPEC_TREE_DIRS)
+
+    def test_from_project_limit(self, spec_tree: Path) -> None:
+        """SpecListing.from_project(limit=n) returns only the first n specs in order"""
+        listing = SpecListing.from_project(spec_tree, limit=2)
+        everything = SpecListing.from_project(spec_tree, limit=100)
+
+        assert [s.name for s in listing.specs] == sorted(SPEC_TREE_DIRS)[:2]
+        assert [s.name for s in everything.specs] == sorted(SPEC_TREE_DIRS)
+
+    def test_from_project_orders_by_numeric_prefix(self, tmp_path: Path) -> None:
+        """SpecListing.from_project() orders unpadded numeric prefixes numerically"""
+        for name in ("10-later", "9-earlier", "notes", "100-last-numbered"):
+            (tmp_path / "specs" / name).mkdir(parents=True)
+
+        listing = SpecListing.from_project(tmp_path)
+
+        assert [s.name for s in listing.specs] == [
+            "9-earlier",
+            "10-later",
+            "100-last-numbered",
+            "notes",
+        ]
+
+    def test_from_project_empty_specs(self, tmp_path: Path) -> None:
         """SpecListing.from_project() returns empty list when no subdirs"""
-        specs_dir = temp_dir / "specs"
-        specs_dir.mkdir()
+        (tmp_path / "specs").mkdir()
 
-        listing = SpecListing.from_project(temp_dir)
+        listing = SpecListing.from_project(tmp_path)
 
-        assert listing.project_root == temp_dir
+        assert listing.project_root == tmp_path
         assert len(listing.specs) == 0
         assert listing.is_empty
 
-    def test_from_project_no_specs_dir(self, temp_dir: Path) -> None:
+    def test_from_project_no_specs_dir(self, tmp_path: Path) -> None:
         """SpecListing.from_project() returns empty list when no specs/ dir"""
-        listing = SpecListing.from_project(temp_dir)
+        listing = SpecListing.from_project(tmp_path)
 
-        assert listing.project_root == temp_dir
+        assert listing.project_root == tmp_path
         assert len(listing.specs) == 0
         assert listing.is_empty
 
-    def test_from_project_excludes_hidden(self, temp_dir: Path) -> None:
-        """SpecListing excludes hidden directories (starting with .)"""
-        specs_dir = temp_dir / "specs"
-        specs_dir.mkdir()
-        (specs_dir / "001-visible").mkdir()
-        (specs_dir / ".hidden").mkdir()
-        (specs_dir / "002-also-visible").mkdir()
-
-        listing = SpecListing.from_project(temp_dir)
-
-        assert len(listing.specs) == 2
-        spec_names = [s.name for s in listing.specs]
-        assert "001-visible" in spec_names
-        assert "002-also-visible" in spec_names
-        assert ".hidden" not in spec_names
-
-    def test_from_project_excludes_files(self, temp_dir: Path) -> None:
-        """SpecListing excludes files, only lists directories"""
-        specs_dir = temp_dir / "specs"
-        specs_dir.mkdir()
-        (specs_dir / "001-spec-dir").mkdir()
-        (specs_dir / "README.md").write_text("readme")
-
-        listing = SpecListing.from_project(temp_dir)
-
-        assert len(listing.specs) == 1
-        assert listing.specs[0].name == "001-spec-dir"
-
 
 class TestSpecDirectory:
     """tests for SpecDirectory model"""
@@ -97,92 +150,162 @@ class TestSpecDirectory:
         assert spec_dir.path == spec_path
 
 
+def fake_proc(
+    pid: int = 0,
+    cmdline: Sequence[str] = (),
+    raises: Exception | None = None,
+    create_time: float = 100.0,
+) -> Any:
+    """lightweight stand-in for psutil.Process"""
+
+    def _cmdline() -> list[str]:
+        if raises is not None:
+            raise raises
+        return list(cmdline)
+
+    return SimpleNamespace(pid=pid, cmdline=_cmdline, create_time=lambda: create_time)
+
+
+@pytest.fixture
+def server_mocks(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    """stub the process lookups behind get_server_status(); tests set the results"""
+    stubs: dict[str, Any] = {"find": None, "is_specbook": False, "root": None, "find_calls": 0}
+
+    def find(port: int) -> Any:
+        stubs["find_calls"] += 1
+        return stubs["find"]
+
+    monkeypatch.setattr(server, "find_process_on_port", find)
+    monkeypatch.setattr(server, "is_specbook_process", lambda proc: stubs["is_specbook"])
+    monkeypatch.setattr(server, "get_project_root_from_process", lambda proc: stubs["root"])
+    return stubs
+
+
 class TestGetServerStatus:
     """tests for get_server_status() (RUNNING, STOPPED, etc) function"""
 
-    def test_returns_stopped_when_no_process(self) -> None:
+    def test_returns_stopped_when_no_process(self, server_mocks: dict[str, Any]) -> None:
         """get_server_status() returns STOPPED when no process on port"""
-        with patch("specbook.core.server.find_process_on_port") as mock_find:
-            mock_find.return_value = None
+        status = get_server_status(7732)
 
-            status = get_server_status(7732)
+        assert status.state == ServerState.STOPPED
+        assert status.port == 7732
+        assert status.pid is None
+        assert status.project_root is None
 
-            assert status.state == ServerState.STOPPED
-            assert status.port == 7732
-            assert status.pid is None
-            assert status.project_root is None
-
-    def test_returns_running_for_specbook_process(self) -> None:
+    def test_returns_running_for_specbook_process(self, server_mocks: dict[str, Any]) -> None:
         """get_server_status() returns RUNNING for specbook process"""
-        mock_proc = MagicMock()
-        mock_proc.pid = 12345
-        mock_proc.cmdline.return_value = [
-            "/usr/bin/python",
-            "-m",
-            "specbook.ui.web.app",
-            "7732",
-            "/path/to/project",
-        ]
-
-        with (
-            patch("specbook.core.server.find_process_on_port") as mock_find,
-            patch("specbook.core.server.is_specbook_process") as mock_is_specbook,
-            patch("specbook.core.server.get_project_root_from_process") as mock_get_root,
-        ):
-            mock_find.return_value = mock_proc
-            mock_is_specbook.return_value = True
-            mock_get_root.return_value = Path("/path/to/project")
+        server_mocks["find"] = fake_proc(pid=12345)
+        server_mocks["is_specbook"] = True
+        server_mocks["root"] = Path("/path/to/project")
 
-            status = get_server_status(7732)
+        status = get_server_status(7732)
 
-            assert status.state == ServerState.RUNNING
-            assert status.port == 7732
-            assert status.pid == 12345
-            assert status.project_root == Path("/path/to/project")
+        assert status.state == ServerState.RUNNING
+        assert status.port == 7732
+        assert status.pid == 12345
+        assert status.project_root == Path("/path/to/project")
 
-    def test_returns_port_conflict_for_other_process(self) -> None:
+    def test_returns_port_conflict_for_other_process(self, server_mocks: dict[str, Any]) -> None:
         """get_server_status() returns PORT_CONFLICT for non-specbook"""
-        mock_proc = MagicMock()
-        mock_proc.pid = 99999
+        server_mocks["find"] = fake_proc(pid=99999)
 
-        with (
-            patch("specbook.core.server.find_process_on_port") as mock_find,
-            patch("specbook.core.server.is_specbook_process") as mock_is_specbook,
-        ):
-            mock_find.return_value = mock_proc
-            mock_is_specbook.return_value = False
+        status = get_server_status(7732)
 
-            status = get_server_status(7732)
+        assert status.state == ServerState.PORT_CONFLICT
+        assert status.port == 7732
+        assert status.pid == 99999
+        assert status.project_root is None
 
-            assert status.state == ServerState.PORT_CONFLICT
-            assert status.port == 7732
-            assert status.pid == 99999
-            assert status.project_root is None
+    def test_reuses_recent_status(self, server_mocks: dict[str, Any]) -> None:
+        """get_server_status() reuses a fresh result instead of rescanning ports"""
+        first = get_server_status(7732)
+        second = get_server_status(7732)
 
+        assert second is first
+        assert server_mocks["find_calls"] == 1
 
-class TestIsSpecbookProcess:
-    """tests for is_specbook_process()"""
+    def test_rescans_when_process_replaced(
+        self, server_mocks: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """get_server_status() rescans when the cached pid now has another create_time"""
+        server_mocks["find"] = fake_proc(pid=99999)
+        replacement = fake_proc(create_time=200.0)
+        monkeypatch.setattr(server.psutil, "Process", lambda pid: replacement)
+
+        get_server_status(7732)
+        get_server_status(7732)
 
-    def test_returns_true_for_specbook_process(self) -> None:
-        """is_specbook_process() returns True when cmdline contains specbook"""
-        mock_proc = MagicMock()
-        mock_proc.cmdline.return_value = ["python", "-m", "specbook.ui.web.app", "7732"]
+        assert server_mocks["find_calls"] == 2
 
-        assert is_specbook_process(mock_proc) is True
 
-    def test_returns_false_for_other_process(self) -> None:
-        """is_specbook_process() returns False for non-specbook process"""
-        mock_proc = MagicMock()
-        mock_proc.cmdline.return_value = ["node", "server.js"]
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+class TestFindPidOnPort:
+    """tests for the Linux /proc port lookup"""
 
-        assert is_specbook_process(mock_proc) is False
+    def test_finds_listening_process(self) -> None:
+        """find_pid_on_port() returns the pid listening on the port"""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            sock.listen()
+            port = sock.getsockname()[1]
 
-    def test_returns_false_on_access_denied(self) -> None:
-        """is_specbook_process() returns False when access is denied"""
-        mock_proc = MagicMock()
-        mock_proc.cmdline.side_effect = psutil.AccessDenied(123)
+            assert find_pid_on_port(port) == os.getpid()
 
-        assert is_specbook_process(mock_proc) is False
+    def test_returns_none_when_nothing_listens(self) -> None:
+        """find_pid_on_port() returns None for a closed port"""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+            assert find_pid_on_port(port) is None
+
+
+class TestIsSpecbookProcess:
+    """tests for is_specbook_process()"""
+
+    @pytest.mark.parametrize(
+        ("proc", "expected"),
+        [
+            # negative pids have no /proc entry, so the stub's cmdline is what's read;
+            # each case has its own, as results are cached per (pid, create_time)
+            (fake_proc(pid=-2, cmdline=["python", "-m", "specbook.ui.web.app", "7732"]), True),
+            (fake_proc(pid=-3, cmdline=["node", "server.js"]), False),
+            (fake_proc(pid=-4, raises=AccessDenied(123)), False),
+        ],
+        ids=["specbook", "other-process", "access-denied"],
+    )
+    def test_detects_specbook_process(self, proc: Any, expected: bool) -> None:
+        """is_specbook_process() is True only for readable cmdlines containing specbook"""
+        assert is_specbook_process(proc) is expected
+
+    def test_caches_result_per_process(self) -> None:
+        """is_specbook_process() reads a given process's cmdline only once"""
+        reads = []
+        proc = fake_proc(pid=-1, cmdline=["python", "-m", "specbook.ui.web.app"])
+        read_cmdline = proc.cmdline
+        proc.cmdline = lambda: reads.append(1) or read_cmdline()
+
+        assert is_specbook_process(proc) is True
+        assert is_specbook_process(proc) is True
+        assert len(reads) == 1
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+    def test_reads_cmdline_from_proc(self) -> None:
+        """is_specbook_process() checks /proc/<pid>/cmdline on Linux"""
+        script = "import sys; print(flush=True); sys.stdin.read()"
+        child = subprocess.Popen(
+            [sys.executable, "-c", script, "specbook-marker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        try:
+            assert child.stdout is not None
+            child.stdout.readline()  # child is running with its final cmdline
+            # the stub's own cmdline says otherwise, so only /proc can answer True
+            assert is_specbook_process(fake_proc(pid=child.pid, cmdline=["node"])) is True
+        finally:
+            child.communicate()
 
 
 class TestGetProjectRootFromProcess:
@@ -190,35 +313,52 @@ class TestGetProjectRootFromProcess:
 
     def test_extracts_from_project_root_flag(self, temp_dir: Path) -> None:
         """extracts path from --project-root"""
-        mock_proc = MagicMock()
-        mock_proc.cmdline.return_value = ["python", "--project-root", str(temp_dir)]
+        proc = fake_proc(cmdline=["python", "--project-root", str(temp_dir)])
 
-        assert get_project_root_from_process(mock_proc) == temp_dir
+        assert get_project_root_from_process(proc) == temp_dir
 
     def test_falls_back_to_last_arg_if_valid_dir(self, temp_dir: Path) -> None:
         """falls back to last arg if it's a valid dir"""
-        mock_proc = MagicMock()
-        mock_proc.cmdline.return_value = ["python", "-m", "app", str(temp_dir)]
+        proc = fake_proc(cmdline=["python", "-m", "app", str(temp_dir)])
 
-        assert get_project_root_from_process(mock_proc) == temp_dir
+        assert get_project_root_from_process(proc) == temp_dir
 
     def test_returns_none_on_access_denied(self) -> None:
         """returns None when process access is denied"""
-        mock_proc = MagicMock()
-        mock_proc.cmdline.side_effect = psutil.AccessDenied(123)
+        proc = fake_proc(raises=AccessDenied(123))
+
+        assert get_project_root_from_process(proc) is None
+
+
+def raising(exc: Exception) -> Any:
+    """stand-in callable that raises exc whatever it is called with"""
+
+    def _raise(*args: object, **kwargs: object) -> None:
+        raise exc
 
-        assert get_project_root_from_process(mock_proc) is None
+    return _raise
 
 
 class TestOpenBrowser:
     """tests for open_browser()"""
 
-    def test_returns_true_on_success(self) -> None:
+    def test_returns_true_on_success(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """open_browser() returns True when browser opens successfully"""
-        with patch("specbook.core.server.webbrowser.open", return_value=True):
-            assert open_browser("http://localhost:7732") is True
+        monkeypatch.setattr("webbrowser.open", lambda url: True)
 
-    def test_returns_false_on_exception(self) -> None:
+        assert open_browser("http://localhost:7732") is True
+
+    def test_returns_false_on_exception(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """open_browser() returns False when browser fails to open"""
-        with patch("specbook.core.server.webbrowser.open", side_effect=Exception("no browser")):
-            assert open_browser("http://localhost:7732") is False
+        monkeypatch.setattr("webbrowser.open", raising(OSError("no browser")))
+
+        assert open_browser("http://localhost:7732") is False
+
+    def test_returns_false_on_webbrowser_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """open_browser() returns False when no runnable browser is found"""
+        import webbrowser
+
+        error = webbrowser.Error("could not locate runnable browser")
+        monkeypatch.setattr("webbrowser.open", raising(error))
+
+        assert open_browser("http://localhost:7732") is False
@@ -1,26 +1,48 @@
 """Unit tests for web API endpoints."""
 
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
+import pytest
 from starlette.testclient import TestClient
 
+from specbook.core.models import SpecStatus
+from specbook.ui.web import app as web_app
+from specbook.ui.web.app import (
+    _build_project_listing,
+    _cached_doc_status,
+    _clear_listing_cache,
+    _discover_project_documents,
+    _get_document_info,
+    _get_project_listing,
+    _parse_completion_status,
+    _render_document,
+    _scan_spec_documents,
+    _scan_status_line,
+    _store_scan,
+    _stored_scan,
+    get_doc_status,
+    parse_frontmatter,
+    scan_markdown,
+)
+
+# keep the web app's scan store out of the real user cache dir
+pytestmark = pytest.mark.usefixtures("isolated_cache_home")
+
 
 class TestApiDocumentRaw:
     """tests for GET /api/document/raw endpoint"""
 
-    def test_returns_raw_markdown_content(self, project_with_specs: Path) -> None:
+    def test_returns_raw_markdown_content(
+        self, client: TestClient, project_with_sample_spec: Path
+    ) -> None:
         """endpoint returns raw markdown without rendering"""
-        from specbook.ui.web.app import create_app
-
-        # create spec with a markdown file
-        spec_dir = project_with_specs / "specs" / "001-test"
-        spec_dir.mkdir(parents=True)
-        doc_path = spec_dir / "spec.md"
-        doc_path.write_text("# Test Spec\n\nSome **bold** content.")
-
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
         response = client.get("/api/document/raw?path=specs/001-test/spec.md")
 
         assert response.status_code == 200
@@ -29,49 +51,29 @@ class TestApiDocumentRaw:
         assert data["raw"] == "# Test Spec\n\nSome **bold** content."
         assert "modified" in data
 
-    def test_returns_404_for_missing_file(self, project_with_specs: Path) -> None:
+    def test_returns_404_for_missing_file(self, client: TestClient) -> None:
         """endpoint returns 404 for non-existent file"""
-        from specbook.ui.web.app import create_app
-
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
         response = client.get("/api/document/raw?path=specs/nonexistent/spec.md")
 
         assert response.status_code == 404
         assert response.json()["error"] == "Document not found"
 
-    def test_returns_400_for_missing_path(self, project_with_specs: Path) -> None:
+    def test_returns_400_for_missing_path(self, client: TestClient) -> None:
         """endpoint returns 400 when path parameter is missing"""
-        from specbook.ui.web.app import create_app
-
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
         response = client.get("/api/document/raw")
 
         assert response.status_code == 400
         assert response.json()["error"] == "Invalid path"
 
-    def test_returns_400_for_non_markdown_file(self, project_with_specs: Path) -> None:
+    def test_returns_400_for_non_markdown_file(self, client: TestClient) -> None:
         """endpoint rejects non-.md files"""
-        from specbook.ui.web.app import create_app
-
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
         response = client.get("/api/document/raw?path=specs/001-test/file.txt")
 
         assert response.status_code == 400
         assert "Only markdown files allowed" in response.json()["detail"]
 
-    def test_blocks_path_traversal(self, project_with_specs: Path) -> None:
+    def test_blocks_path_traversal(self, client: TestClient) -> None:
         """endpoint blocks directory traversal attacks"""
-        from specbook.ui.web.app import create_app
-
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
         response = client.get("/api/document/raw?path=../../../etc/passwd.md")
 
         assert response.status_code == 400
@@ -81,19 +83,15 @@ class TestApiDocumentRaw:
 class TestApiDocumentSave:
     """tests for POST /api/document endpoint"""
 
-    def test_saves_content_to_file(self, project_with_specs: Path) -> None:
+    def test_saves_content_to_file(
+        self, client: TestClient, project_with_sample_spec: Path
+    ) -> None:
         """endpoint saves content to existing file"""
-        from specbook.ui.web.app import create_app
-
         # create spec with a markdown file
-        spec_dir = project_with_specs / "specs" / "001-test"
-        spec_dir.mkdir(parents=True)
+        spec_dir = project_with_sample_spec / "specs" / "001-test"
         doc_path = spec_dir / "spec.md"
         doc_path.write_text("# Original Content")
 
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
         response = client.post(
             "/api/document",
             json={
@@ -111,13 +109,8 @@ class TestApiDocumentSave:
         # verify file was actually updated
         assert doc_path.read_text() == "# Updated Content\n\nNew text here."
 
-    def test_returns_404_for_missing_file(self, project_with_specs: Path) -> None:
+    def test_returns_404_for_missing_file(self, client: TestClient) -> None:
         """endpoint returns 404 when trying to save to non-existent file"""
-        from specbook.ui.web.app import create_app
-
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
         response = client.post(
             "/api/document",
             json={
@@ -129,74 +122,59 @@ class TestApiDocumentSave:
         assert response.status_code == 404
         assert response.json()["error"] == "Document not found"
 
-    def test_returns_400_for_missing_content(self, project_with_specs: Path) -> None:
-        """endpoint returns 400 when content field is missing"""
-        from specbook.ui.web.app import create_app
-
-        spec_dir = project_with_specs / "specs" / "001-test"
-        spec_dir.mkdir(parents=True)
+    @pytest.mark.parametrize(
+        ("request_kwargs", "expected_detail"),
+        [
+            pytest.param(
+                {"json": {"path": "specs/001-test/spec.md"}},
+                "Missing content field",
+                id="missing-content",
+            ),
+            pytest.param(
+                {"content": "not valid json", "headers": {"Content-Type": "application/json"}},
+                "Invalid JSON body",
+                id="invalid-json",
+            ),
+            pytest.param(
+                {"json": {"path": "../../../tmp/malicious.md", "content": "# Bad Content"}},
+                "Path outside project root",
+                id="path-traversal",
+            ),
+        ],
+    )
+    def test_rejects_invalid_request(
+        self,
+        client: TestClient,
+        project_with_sample_spec: Path,
+        request_kwargs: dict[str, Any],
+        expected_detail: str,
+    ) -> None:
+        """endpoint returns 400 for malformed or unsafe save requests"""
+        spec_dir = project_with_sample_spec / "specs" / "001-test"
         (spec_dir / "spec.md").write_text("# Test")
 
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
-        response = client.post(
-            "/api/document",
-            json={"path": "specs/001-test/spec.md"},
-        )
-
-        assert response.status_code == 400
-        assert "Missing content field" in response.json()["detail"]
-
-    def test_returns_400_for_invalid_json(self, project_with_specs: Path) -> None:
-        """endpoint returns 400 for invalid JSON body"""
-        from specbook.ui.web.app import create_app
-
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
-        response = client.post(
-            "/api/document",
-            content="not valid json",
-            headers={"Content-Type": "application/json"},
-        )
+        response = client.post("/api/document", **request_kwargs)
 
         assert response.status_code == 400
-        assert "Invalid JSON body" in response.json()["detail"]
-
-    def test_blocks_path_traversal(self, project_with_specs: Path) -> None:
-        """endpoint blocks directory traversal in save"""
-        from specbook.ui.web.app import create_app
+        assert expected_detail in response.json()["detail"]
+        assert (spec_dir / "spec.md").read_text() == "# Test"
 
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
-        response = client.post(
-            "/api/document",
-            json={
-                "path": "../../../tmp/malicious.md",
-                "content": "# Bad Content",
-            },
-        )
+    def test_rejects_other_methods(self, client: TestClient) -> None:
+        """endpoint only accepts GET and POST"""
+        response = client.put("/api/document", json={"path": "x.md", "content": ""})
 
-        assert response.status_code == 400
-        assert "Path outside project root" in response.json()["detail"]
+        assert response.status_code == 405
 
 
 class TestApiCheckboxToggle:
     """tests for POST /api/checkbox endpoint"""
 
-    def test_toggles_unchecked_to_checked(self, project_with_specs: Path) -> None:
+    def test_toggles_unchecked_to_checked(
+        self, client: TestClient, project_with_sample_spec: Path
+    ) -> None:
         """endpoint toggles unchecked checkbox to checked"""
-        from specbook.ui.web.app import create_app
-
-        spec_dir = project_with_specs / "specs" / "001-test"
-        spec_dir.mkdir(parents=True)
+        spec_dir = project_with_sample_spec / "specs" / "001-test"
         doc_path = spec_dir / "tasks.md"
-        doc_path.write_text("# Tasks\n\n- [ ] First task\n- [ ] Second task\n")
-
-        app = create_app(project_with_specs)
-        client = TestClient(app)
 
         response = client.post(
             "/api/checkbox",
@@ -218,18 +196,14 @@ class TestApiCheckboxToggle:
         assert "- [x] First task" in content
         assert "- [ ] Second task" in content
 
-    def test_toggles_checked_to_unchecked(self, project_with_specs: Path) -> None:
+    def test_toggles_checked_to_unchecked(
+        self, client: TestClient, project_with_sample_spec: Path
+    ) -> None:
         """endpoint toggles checked checkbox to unchecked"""
-        from specbook.ui.web.app import create_app
-
-        spec_dir = project_with_specs / "specs" / "001-test"
-        spec_dir.mkdir(parents=True)
+        spec_dir = project_with_sample_spec / "specs" / "001-test"
         doc_path = spec_dir / "tasks.md"
         doc_path.write_text("# Tasks\n\n- [x] First task\n- [x] Second task\n")
 
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
         response = client.post(
             "/api/checkbox",
             json={
@@ -249,111 +223,122 @@ class TestApiCheckboxToggle:
         assert "- [x] First task" in content
         assert "- [ ] Second task" in content
 
-    def test_returns_400_for_non_checkbox_line(self, project_with_specs: Path) -> None:
-        """endpoint returns 400 when line is not a checkbox"""
-        from specbook.ui.web.app import create_app
-
-        spec_dir = project_with_specs / "specs" / "001-test"
-        spec_dir.mkdir(parents=True)
+    def test_toggles_last_line_without_trailing_newline(
+        self, client: TestClient, project_with_sample_spec: Path
+    ) -> None:
+        """endpoint toggles the final line and leaves the rest of the file intact"""
+        spec_dir = project_with_sample_spec / "specs" / "001-test"
         doc_path = spec_dir / "tasks.md"
-        doc_path.write_text("# Tasks\n\nJust some text here\n")
-
-        app = create_app(project_with_specs)
-        client = TestClient(app)
+        doc_path.write_text("# Tasks\n\n- [ ] First task\n  - [ ] Subtask")
 
         response = client.post(
             "/api/checkbox",
             json={
                 "path": "specs/001-test/tasks.md",
-                "lineNumber": 3,
+                "lineNumber": 4,
                 "checked": True,
             },
         )
 
-        assert response.status_code == 400
-        assert "not a checkbox item" in response.json()["detail"]
-
-    def test_returns_400_for_invalid_line_number(self, project_with_specs: Path) -> None:
-        """endpoint returns 400 for out of range line number"""
-        from specbook.ui.web.app import create_app
-
-        spec_dir = project_with_specs / "specs" / "001-test"
-        spec_dir.mkdir(parents=True)
-        doc_path = spec_dir / "tasks.md"
-        doc_path.write_text("# Tasks\n\n- [ ] Only task\n")
-
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
-        response = client.post(
+        assert response.status_code == 200
+        assert doc_path.read_text() == "# Tasks\n\n- [ ] First task\n  - [x] Subtask"
+
+    def test_concurrent_toggles_on_one_file_both_land(
+        self,
+        client: TestClient,
+        project_with_sample_spec: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """two simultaneous toggles of different lines don't overwrite each other"""
+        doc_path = project_with_sample_spec / "specs" / "001-test" / "tasks.md"
+        read_text = Path.read_text
+
+        def slow_read_text(self: Path, *args: Any, **kwargs: Any) -> str:
+            # widen the read-to-write window so unserialized toggles would overlap
+            content = read_text(self, *args, **kwargs)
+            time.sleep(0.05)
+            return content
+
+        monkeypatch.setattr(Path, "read_text", slow_read_text)
+
+        def toggle(line_number: int) -> int:
+            response = client.post(
+                "/api/checkbox",
+                json={
+                    "path": "specs/001-test/tasks.md",
+                    "lineNumber": line_number,
+                    "checked": True,
+                },
+            )
+            return response.status_code
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            statuses = list(executor.map(toggle, [3, 4]))
+
+        assert statuses == [200, 200]
+        assert read_text(doc_path) == "# Tasks\n\n- [x] First task\n- [x] Second task\n"
+
+    def test_toggle_refreshes_caches_when_mtime_unchanged(
+        self, client: TestClient, project_with_sample_spec: Path
+    ) -> None:
+        """a same-size toggle within one mtime tick still refreshes views and listing"""
+        doc_path = project_with_sample_spec / "specs" / "001-test" / "tasks.md"
+        url = "/api/document?path=specs/001-test/tasks.md"
+        etag = client.get(url).headers["etag"]
+        client.get("/")
+        before = doc_path.stat()
+
+        client.post(
             "/api/checkbox",
-            json={
-                "path": "specs/001-test/tasks.md",
-                "lineNumber": 999,
-                "checked": True,
-            },
+            json={"path": "specs/001-test/tasks.md", "lineNumber": 3, "checked": True},
         )
+        # simulate a coarse-timestamp filesystem: the write didn't move mtime
+        os.utime(doc_path, ns=(before.st_atime_ns, before.st_mtime_ns))
 
-        assert response.status_code == 400
-        assert "exceeds file length" in response.json()["detail"]
-
-    def test_returns_400_for_negative_line_number(self, project_with_specs: Path) -> None:
-        """endpoint returns 400 for negative line number"""
-        from specbook.ui.web.app import create_app
+        view = client.get(url, headers={"If-None-Match": etag})
+        _, listing, _ = _get_project_listing(project_with_sample_spec)
 
-        spec_dir = project_with_specs / "specs" / "001-test"
-        spec_dir.mkdir(parents=True)
-        (spec_dir / "tasks.md").write_text("# Tasks\n")
-
-        app = create_app(project_with_specs)
-        client = TestClient(app)
+        assert view.status_code == 200
+        assert view.json()["tasks"] == {"total": 2, "completed": 1}
+        assert listing.specs[0].completion.completed_tasks == 1
 
-        response = client.post(
+    def test_late_reader_of_old_bytes_cannot_repopulate_caches(
+        self,
+        client: TestClient,
+        project_with_sample_spec: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """results a reader computes from pre-write bytes, but caches only after the
+        write completed, are never served for the new content"""
+        doc_path = project_with_sample_spec / "specs" / "001-test" / "tasks.md"
+        old_bytes = doc_path.read_bytes()
+        before = doc_path.stat()
+
+        client.post(
             "/api/checkbox",
-            json={
-                "path": "specs/001-test/tasks.md",
-                "lineNumber": -1,
-                "checked": True,
-            },
+            json={"path": "specs/001-test/tasks.md", "lineNumber": 3, "checked": True},
         )
+        os.utime(doc_path, ns=(before.st_atime_ns, before.st_mtime_ns))
 
-        assert response.status_code == 400
-        assert "positive integer" in response.json()["detail"]
-
-    def test_returns_400_for_missing_checked_field(self, project_with_specs: Path) -> None:
-        """endpoint returns 400 when checked field is missing"""
-        from specbook.ui.web.app import create_app
-
-        spec_dir = project_with_specs / "specs" / "001-test"
-        spec_dir.mkdir(parents=True)
-        (spec_dir / "tasks.md").write_text("# Tasks\n- [ ] Task\n")
+        # a reader that took its write count before the toggle and read the old bytes
+        with monkeypatch.context() as m:
+            m.setattr(Path, "read_bytes", lambda self: old_bytes)
+            _render_document(str(doc_path), before.st_mtime_ns, before.st_size, 0)
+        _store_scan(str(doc_path), before.st_mtime_ns, before.st_size, 0, "tasks", [2, 0])
 
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
-        response = client.post(
-            "/api/checkbox",
-            json={
-                "path": "specs/001-test/tasks.md",
-                "lineNumber": 2,
-            },
-        )
+        view = client.get("/api/document?path=specs/001-test/tasks.md")
 
-        assert response.status_code == 400
-        assert "checked must be a boolean" in response.json()["detail"]
+        assert view.json()["tasks"] == {"total": 2, "completed": 1}
+        assert _stored_scan(str(doc_path), before.st_mtime_ns, before.st_size, "tasks") is None
 
-    def test_preserves_indented_checkboxes(self, project_with_specs: Path) -> None:
+    def test_preserves_indented_checkboxes(
+        self, client: TestClient, project_with_sample_spec: Path
+    ) -> None:
         """endpoint handles indented checkboxes correctly"""
-        from specbook.ui.web.app import create_app
-
-        spec_dir = project_with_specs / "specs" / "001-test"
-        spec_dir.mkdir(parents=True)
+        spec_dir = project_with_sample_spec / "specs" / "001-test"
         doc_path = spec_dir / "tasks.md"
         doc_path.write_text("# Tasks\n\n  - [ ] Indented task\n")
 
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
         response = client.post(
             "/api/checkbox",
             json={
@@ -369,67 +354,123 @@ class TestApiCheckboxToggle:
         content = doc_path.read_text()
         assert "  - [x] Indented task" in content
 
-    def test_blocks_path_traversal(self, project_with_specs: Path) -> None:
-        """endpoint blocks directory traversal in checkbox toggle"""
-        from specbook.ui.web.app import create_app
-
-        app = create_app(project_with_specs)
-        client = TestClient(app)
+    @pytest.mark.parametrize(
+        ("payload", "expected_detail"),
+        [
+            pytest.param(
+                {"path": "specs/001-test/tasks.md", "lineNumber": 3, "checked": True},
+                "not a checkbox item",
+                id="non-checkbox-line",
+            ),
+            pytest.param(
+                {"path": "specs/001-test/tasks.md", "lineNumber": 999, "checked": True},
+                "exceeds file length",
+                id="line-out-of-range",
+            ),
+            pytest.param(
+                {"path": "specs/001-test/tasks.md", "lineNumber": -1, "checked": True},
+                "positive integer",
+                id="negative-line",
+            ),
+            pytest.param(
+                {"path": "specs/001-test/tasks.md", "lineNumber": 4},
+                "checked must be a boolean",
+                id="missing-checked",
+            ),
+            pytest.param(
+                {"path": "../../../tmp/malicious.md", "lineNumber": 1, "checked": True},
+                "Path outside project root",
+                id="path-traversal",
+            ),
+        ],
+    )
+    def test_rejects_invalid_request(
+        self,
+        client: TestClient,
+        project_with_sample_spec: Path,
+        payload: dict[str, Any],
+        expected_detail: str,
+    ) -> None:
+        """endpoint returns 400 for malformed or unsafe toggle requests"""
+        spec_dir = project_with_sample_spec / "specs" / "001-test"
+        doc_path = spec_dir / "tasks.md"
+        doc_path.write_text("# Tasks\n\nJust some text here\n- [ ] Only task\n")
 
-        response = client.post(
-            "/api/checkbox",
-            json={
-                "path": "../../../tmp/malicious.md",
-                "lineNumber": 1,
-                "checked": True,
-            },
-        )
+        response = client.post("/api/checkbox", json=payload)
 
         assert response.status_code == 400
-        assert "Path outside project root" in response.json()["detail"]
+        assert expected_detail in response.json()["detail"]
+        assert doc_path.read_text() == "# Tasks\n\nJust some text here\n- [ ] Only task\n"
 
 
 class TestPathValidation:
     """tests for path validation helper"""
 
-    def test_rejects_absolute_paths(self, project_with_specs: Path) -> None:
+    def test_rejects_absolute_paths(self, client: TestClient) -> None:
         """validation rejects absolute paths"""
-        from specbook.ui.web.app import create_app
-
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
         response = client.get("/api/document/raw?path=/etc/passwd.md")
 
         assert response.status_code == 400
 
-    def test_rejects_double_dot_traversal(self, project_with_specs: Path) -> None:
+    def test_rejects_double_dot_traversal(self, client: TestClient) -> None:
         """validation rejects .. traversal"""
-        from specbook.ui.web.app import create_app
+        response = client.get("/api/document/raw?path=specs/../../../etc/passwd.md")
 
-        app = create_app(project_with_specs)
-        client = TestClient(app)
+        assert response.status_code == 400
 
-        response = client.get("/api/document/raw?path=specs/../../../etc/passwd.md")
+    def test_allows_dot_segments_within_root(
+        self, client: TestClient, project_with_sample_spec: Path
+    ) -> None:
+        """validation accepts paths that normalize to a location inside the root"""
+        spec_dir = project_with_sample_spec / "specs" / "001-test"
+        (spec_dir / "spec.md").write_text("# Spec")
+
+        response = client.get("/api/document/raw?path=specs/./001-test/../001-test/spec.md")
+
+        assert response.status_code == 200
+
+    def test_rejects_symlink_escaping_root(
+        self, client: TestClient, project_with_specs: Path, tmp_path: Path
+    ) -> None:
+        """validation rejects symlinks that point outside the project root"""
+        outside = tmp_path / "secret.md"
+        outside.write_text("# Secret")
+        (project_with_specs / "specs" / "link.md").symlink_to(outside)
+
+        response = client.get("/api/document/raw?path=specs/link.md")
 
         assert response.status_code == 400
+        assert "Path outside project root" in response.json()["detail"]
+
+    def test_rejects_dot_dot_after_symlinked_directory(
+        self, client: TestClient, project_with_specs: Path, tmp_path: Path
+    ) -> None:
+        """validation resolves .. after a symlinked directory the way the OS does"""
+        outside = tmp_path / "outside"
+        (outside / "sub").mkdir(parents=True)
+        secret = outside / "secret.md"
+        secret.write_text("# Secret")
+        (project_with_specs / "specs" / "link").symlink_to(outside / "sub")
+
+        read = client.get("/api/document/raw?path=specs/link/../secret.md")
+        save = client.post(
+            "/api/document",
+            json={"path": "specs/link/../secret.md", "content": "# Overwritten"},
+        )
+
+        assert read.status_code == 400
+        assert save.status_code == 400
+        assert "Path outside project root" in save.json()["detail"]
+        assert secret.read_text() == "# Secret"
 
 
 class TestApiDocument:
     """tests for GET /api/document endpoint (renders markdown to HTML)"""
 
-    def test_returns_rendered_html(self, project_with_specs: Path) -> None:
+    def test_returns_rendered_html(
+        self, client: TestClient, project_with_sample_spec: Path
+    ) -> None:
         """endpoint returns rendered HTML content"""
-        from specbook.ui.web.app import create_app
-
-        spec_dir = project_with_specs / "specs" / "001-test"
-        spec_dir.mkdir(parents=True)
-        doc_path = spec_dir / "spec.md"
-        doc_path.write_text("# Test Spec\n\nSome **bold** content.")
-
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
         response = client.get("/api/document?path=specs/001-test/spec.md")
 
         assert response.status_code == 200
@@ -441,112 +482,221 @@ class TestApiDocument:
         assert "modified" in data
         assert "created" in data
 
-    def test_extracts_h1_as_title(self, project_with_specs: Path) -> None:
-        """endpoint uses first h1 as title"""
-        from specbook.ui.web.app import create_app
+    def test_includes_task_counts(self, client: TestClient, project_with_sample_spec: Path) -> None:
+        """endpoint reports checkbox totals for the document"""
+        spec_dir = project_with_sample_spec / "specs" / "001-test"
+        (spec_dir / "tasks.md").write_text("# Tasks\n- [x] Done\n- [ ] Pending\n- [ ] Later")
 
-        spec_dir = project_with_specs / "specs" / "001-test"
-        spec_dir.mkdir(parents=True)
-        doc_path = spec_dir / "plan.md"
-        doc_path.write_text("# Implementation Plan\n\nDetails here.")
+        response = client.get("/api/document?path=specs/001-test/tasks.md")
 
-        app = create_app(project_with_specs)
-        client = TestClient(app)
+        assert response.status_code == 200
+        assert response.json()["tasks"] == {"total": 3, "completed": 1}
 
+    def test_extracts_h1_as_title(self, client: TestClient, project_with_sample_spec: Path) -> None:
+        """endpoint uses first h1 as title"""
         response = client.get("/api/document?path=specs/001-test/plan.md")
 
         assert response.status_code == 200
         assert response.json()["title"] == "Implementation Plan"
 
-    def test_uses_filename_as_fallback_title(self, project_with_specs: Path) -> None:
+    def test_uses_filename_as_fallback_title(
+        self, client: TestClient, project_with_sample_spec: Path
+    ) -> None:
         """endpoint uses filename if no h1 found"""
-        from specbook.ui.web.app import create_app
-
-        spec_dir = project_with_specs / "specs" / "001-test"
-        spec_dir.mkdir(parents=True)
+        spec_dir = project_with_sample_spec / "specs" / "001-test"
         doc_path = spec_dir / "notes.md"
         doc_path.write_text("Just some notes, no heading.")
 
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
         response = client.get("/api/document?path=specs/001-test/notes.md")
 
         assert response.status_code == 200
         assert response.json()["title"] == "notes"
 
-    def test_returns_404_for_missing_file(self, project_with_specs: Path) -> None:
+    def test_returns_404_for_missing_file(self, client: TestClient) -> None:
         """endpoint returns 404 for non-existent file"""
-        from specbook.ui.web.app import create_app
-
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
         response = client.get("/api/document?path=specs/nonexistent/spec.md")
 
         assert response.status_code == 404
 
+    def test_returns_304_for_matching_etag(
+        self, client: TestClient, project_with_sample_spec: Path
+    ) -> None:
+        """endpoint answers a conditional request for an unchanged doc with 304"""
+        spec_dir = project_with_sample_spec / "specs" / "001-test"
+        doc_path = spec_dir / "spec.md"
+        doc_path.write_text("# Spec")
+
+        first = client.get("/api/document?path=specs/001-test/spec.md")
+        etag = first.headers["etag"]
+        cached = client.get(
+            "/api/document?path=specs/001-test/spec.md", headers={"If-None-Match": etag}
+        )
+        doc_path.write_text("# Spec, edited")
+        edited = client.get(
+            "/api/document?path=specs/001-test/spec.md", headers={"If-None-Match": etag}
+        )
+
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert edited.status_code == 200
+        assert edited.headers["etag"] != etag
+
+    def test_rerenders_after_edit(self, client: TestClient, project_with_sample_spec: Path) -> None:
+        """endpoint serves fresh content after the file changes"""
+        spec_dir = project_with_sample_spec / "specs" / "001-test"
+        doc_path = spec_dir / "spec.md"
+        doc_path.write_text("# First\n\nOriginal.")
+
+        first = client.get("/api/document?path=specs/001-test/spec.md")
+        doc_path.write_text("# Second Title\n\nEdited content.")
+        second = client.get("/api/document?path=specs/001-test/spec.md")
+
+        assert first.json()["title"] == "First"
+        assert second.json()["title"] == "Second Title"
+        assert "Edited content." in second.json()["content"]
+
+
+class TestScanMarkdown:
+    """tests for scan_markdown helper function"""
+
+    def test_title_on_first_line(self) -> None:
+        """function reads an h1 on the first line"""
+        title, _, _ = scan_markdown(b"# Spec Title  \n\nBody")
+        assert title == "Spec Title"
+
+    def test_title_on_later_line(self) -> None:
+        """function finds the first h1 after other content, ignoring h2"""
+        title, _, _ = scan_markdown(b"intro\n## Section\n# Real Title\n# Second Title")
+        assert title == "Real Title"
+
+    def test_title_without_trailing_newline(self) -> None:
+        """function handles an h1 on the last line"""
+        title, _, _ = scan_markdown(b"text\n# Last")
+        assert title == "Last"
+
+    def test_returns_none_without_h1(self) -> None:
+        """function returns no title when there is no h1"""
+        title, _, _ = scan_markdown(b"## Only h2\n#not a heading")
+        assert title is None
+
+    def test_counts_checkboxes_alongside_title(self) -> None:
+        """function counts checkboxes in the same pass, including on the h1 line"""
+        data = "# Tâches - [ ] odd\n- [x] Done\n  - [ ] Nested\n- [X] Upper\n".encode()
+        title, checked, unchecked = scan_markdown(data)
+
+        assert title == "Tâches - [ ] odd"
+        assert checked == 2
+        assert unchecked == 2
+
+
+class TestMarkdownRenderers:
+    """the optional markdown-it-pyrs renderer (specbook[fast]) against the default"""
+
+    PARITY_DOC = (
+        "# Tasks\n\n"
+        "- [ ] Open task\n"
+        "- [x] Done task\n"
+        "  - [X] Nested done\n"
+        "  - [ ] Nested open\n\n"
+        "| a | b |\n|---|---|\n| 1 | ~~2~~ |\n\n"
+        "Some **bold** and `code`.\n"
+    )
+
+    def test_fast_renderer_matches_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """both renderers emit the same html and the same task checkboxes the toggle
+        UI finds (it drops disabled itself, and checked may be spelled either way)"""
+        pytest.importorskip("markdown_it_pyrs")
+        input_tag = re.compile(r"<input [^>]*>")
+
+        def checkboxes(html: str) -> list[tuple[bool, bool]]:
+            return [
+                ('class="task-list-item-checkbox"' in tag, "checked" in tag)
+                for tag in input_tag.findall(html)
+            ]
+
+        web_app._get_md_render.cache_clear()
+        with monkeypatch.context() as m:
+            m.setitem(sys.modules, "markdown_it_pyrs", None)  # import fails: fallback
+            default_html = web_app._get_md_render()(self.PARITY_DOC)
+        web_app._get_md_render.cache_clear()
+        fast_html = web_app._get_md_render()(self.PARITY_DOC)
+
+        assert checkboxes(fast_html) == checkboxes(default_html)
+        assert checkboxes(fast_html) == [(True, False), (True, True), (True, True), (True, False)]
+        assert input_tag.sub("<input>", fast_html) == input_tag.sub("<input>", default_html)
+
 
 class TestIndex:
     """tests for GET / endpoint (main pg)"""
 
-    def test_renders_index_page(self, project_with_specs: Path) -> None:
+    def test_renders_index_page(self, client: TestClient, project_with_specs: Path) -> None:
         """index endpoint returns HTML page"""
-        from specbook.ui.web.app import create_app
-
         spec_dir = project_with_specs / "specs" / "001-test"
         spec_dir.mkdir(parents=True)
         (spec_dir / "spec.md").write_text("# Test")
 
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
         response = client.get("/")
 
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
-    def test_includes_project_documents(self, project_with_specs: Path) -> None:
+    def test_includes_project_documents(self, client: TestClient, project_with_specs: Path) -> None:
         """index page includes project-level documents"""
-        from specbook.ui.web.app import create_app
-
         (project_with_specs / "CLAUDE.md").write_text("# Claude Rules")
 
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
         response = client.get("/")
 
         assert response.status_code == 200
         # CLAUDE.md example should be discovered as a project doc
         assert response.text  # just verify it renders
 
-    def test_includes_specs(self, project_with_specs: Path) -> None:
+    def test_includes_specs(self, client: TestClient, project_with_specs: Path) -> None:
         """index page includes specs directory"""
-        from specbook.ui.web.app import create_app
-
         spec_dir = project_with_specs / "specs" / "001-core"
         spec_dir.mkdir(parents=True)
         (spec_dir / "spec.md").write_text("# Core Spec")
         (spec_dir / "tasks.md").write_text("# Tasks\n- [ ] Task 1")
 
-        app = create_app(project_with_specs)
-        client = TestClient(app)
-
         response = client.get("/")
 
         assert response.status_code == 200
         # spec.md spec title should rendered on page
         assert "001-core" in response.text
 
+    def test_reflects_new_specs_after_cached_render(
+        self, client: TestClient, project_with_specs: Path
+    ) -> None:
+        """index page is re-rendered once the project changes"""
+        (project_with_specs / "specs" / "001-core").mkdir()
+
+        first = client.get("/")
+        repeat = client.get("/")
+        (project_with_specs / "specs" / "002-added").mkdir()
+        updated = client.get("/")
+
+        assert repeat.text == first.text
+        assert "002-added" not in first.text
+        assert "002-added" in updated.text
+
+    def test_returns_304_for_matching_etag(
+        self, client: TestClient, project_with_specs: Path
+    ) -> None:
+        """index answers a conditional request with 304 until the project changes"""
+        etag = client.get("/").headers["etag"]
+        cached = client.get("/", headers={"If-None-Match": etag})
+        (project_with_specs / "specs" / "001-new").mkdir()
+        changed = client.get("/", headers={"If-None-Match": etag})
+
+        assert cached.status_code == 304
+        assert changed.status_code == 200
+        assert "001-new" in changed.text
+
 
 class TestProjectListing:
     """tests for _build_project_listing function"""
 
     def test_builds_empty_project_listing(self, project_with_specs: Path) -> None:
         """listing for project with no specs"""
-        from specbook.ui.web.app import _build_project_listing
-
         listing = _build_project_listing(project_with_specs)
 
         assert listing.project_root == project_with_specs
@@ -556,8 +706,6 @@ class TestProjectListing:
 
     def test_discovers_specs(self, project_with_specs: Path) -> None:
         """listing discovers spec directories"""
-        from specbook.ui.web.app import _build_project_listing
-
         spec_dir = project_with_specs / "specs" / "001-core"
         spec_dir.mkdir(parents=True)
         (spec_dir / "spec.md").write_text("# Core")
@@ -568,10 +716,17 @@ class TestProjectListing:
         assert listing.specs[0].name == "001-core"
         assert listing.is_empty is False
 
+    def test_orders_specs_by_numeric_prefix(self, project_with_specs: Path) -> None:
+        """listing orders specs like SpecListing (10-x after 9-x)"""
+        for name in ("10-later", "9-earlier"):
+            (project_with_specs / "specs" / name).mkdir()
+
+        listing = _build_project_listing(project_with_specs)
+
+        assert [s.name for s in listing.specs] == ["9-earlier", "10-later"]
+
     def test_parses_completion_status(self, project_with_specs: Path) -> None:
         """listing includes completion status from tasks.md"""
-        from specbook.ui.web.app import _build_project_listing
-
         spec_dir = project_with_specs / "specs" / "002-feature"
         spec_dir.mkdir(parents=True)
         (spec_dir / "spec.md").write_text("# Feature")
@@ -584,8 +739,6 @@ class TestProjectListing:
 
     def test_discovers_project_documents(self, project_with_specs: Path) -> None:
         """listing discovers CLAUDE.md and other project docs"""
-        from specbook.ui.web.app import _build_project_listing
-
         (project_with_specs / "CLAUDE.md").write_text("# Rules")
 
         listing = _build_project_listing(project_with_specs)
@@ -596,8 +749,6 @@ class TestProjectListing:
 
     def test_scans_multiple_specs(self, project_with_specs: Path) -> None:
         """listing discovers multiple spec directories"""
-        from specbook.ui.web.app import _build_project_listing
-
         for i in range(1, 4):
             spec_dir = project_with_specs / "specs" / f"00{i}-spec"
             spec_dir.mkdir(parents=True)
@@ -615,8 +766,6 @@ class TestDocumentInfo:
 
     def test_known_document_types(self) -> None:
         """function returns info for known document types"""
-        from specbook.ui.web.app import _get_document_info
-
         display, doc_type, order = _get_document_info("spec.md")
         assert display == "Specification"
         assert doc_type == "spec"
@@ -629,16 +778,12 @@ class TestDocumentInfo:
 
     def test_claude_document(self) -> None:
         """function recognizes CLAUDE.md"""
-        from specbook.ui.web.app import _get_document_info
-
         display, doc_type, order = _get_document_info("CLAUDE.md")
         assert display == "Claude Rules"
         assert doc_type == "claude"
 
     def test_unknown_markdown_file(self) -> None:
         """function handles unknown markdown files"""
-        from specbook.ui.web.app import _get_document_info
-
         display, doc_type, order = _get_document_info("custom-notes.md")
         assert display == "Custom Notes"
         assert doc_type == "other"
@@ -646,8 +791,6 @@ class TestDocumentInfo:
 
     def test_non_markdown_file(self) -> None:
         """function handles non-markdown files"""
-        from specbook.ui.web.app import _get_document_info
-
         display, doc_type, order = _get_document_info("README.txt")
         assert display == "Readme.Txt"
         assert doc_type == "other"
@@ -658,8 +801,6 @@ class TestScanSpecDocuments:
 
     def test_scans_markdown_files(self, project_with_specs: Path) -> None:
         """function finds markdown files in spec directory"""
-        from specbook.ui.web.app import _scan_spec_documents
-
         spec_dir = project_with_specs / "specs" / "001-test"
         spec_dir.mkdir(parents=True)
         (spec_dir / "spec.md").write_text("# Spec")
@@ -673,8 +814,6 @@ class TestScanSpecDocuments:
 
     def test_scans_subdirectories(self, project_with_specs: Path) -> None:
         """function finds markdown files in subdirectories"""
-        from specbook.ui.web.app import _scan_spec_documents
-
         spec_dir = project_with_specs / "specs" / "001-test"
         spec_dir.mkdir(parents=True)
         (spec_dir / "spec.md").write_text("# Spec")
@@ -691,8 +830,6 @@ class TestScanSpecDocuments:
 
     def test_returns_empty_for_missing_directory(self, project_with_specs: Path) -> None:
         """function returns empty list for non-existent directory"""
-        from specbook.ui.web.app import _scan_spec_documents
-
         spec_dir = project_with_specs / "specs" / "nonexistent"
 
         docs = _scan_spec_documents(spec_dir)
@@ -701,8 +838,6 @@ class TestScanSpecDocuments:
 
     def test_sorts_by_document_type_priority(self, project_with_specs: Path) -> None:
         """function sorts documents by type priority"""
-        from specbook.ui.web.app import _scan_spec_documents
-
         spec_dir = project_with_specs / "specs" / "001-test"
         spec_dir.mkdir(parents=True)
         (spec_dir / "tasks.md").write_text("# Tasks")
@@ -720,22 +855,25 @@ class TestScanSpecDocuments:
 class TestParseCompletionStatus:
     """tests for _parse_completion_status function"""
 
-    def test_counts_checkboxes(self, project_with_specs: Path) -> None:
+    def test_counts_checkboxes(self) -> None:
         """function counts checked and unchecked items"""
-        from specbook.ui.web.app import _parse_completion_status
+        status = _parse_completion_status("# Tasks\n- [x] Done\n- [ ] Pending\n- [x] Also Done")
 
+        assert status.total_tasks == 3
+        assert status.completed_tasks == 2
+
+    def test_reads_tasks_file(self, project_with_specs: Path) -> None:
+        """function reads the file when given a path"""
         tasks_file = project_with_specs / "tasks.md"
-        tasks_file.write_text("# Tasks\n- [x] Done\n- [ ] Pending\n- [x] Also Done")
+        tasks_file.write_text("# Tasks\n- [x] Done\n- [ ] Pending\n")
 
         status = _parse_completion_status(tasks_file)
 
-        assert status.total_tasks == 3
-        assert status.completed_tasks == 2
+        assert status.total_tasks == 2
+        assert status.completed_tasks == 1
 
     def test_handles_missing_file(self, project_with_specs: Path) -> None:
         """function returns empty status for missing file"""
-        from specbook.ui.web.app import _parse_completion_status
-
         tasks_file = project_with_specs / "tasks.md"
 
         status = _parse_completion_status(tasks_file)
@@ -743,37 +881,98 @@ class TestParseCompletionStatus:
         assert status.total_tasks == 0
         assert status.completed_tasks == 0
 
-    def test_handles_file_with_no_checkboxes(self, project_with_specs: Path) -> None:
+    def test_handles_file_with_no_checkboxes(self) -> None:
         """function returns zero status for file with no checkboxes"""
-        from specbook.ui.web.app import _parse_completion_status
-
-        tasks_file = project_with_specs / "notes.md"
-        tasks_file.write_text("# Notes\nJust some text here.")
-
-        status = _parse_completion_status(tasks_file)
+        status = _parse_completion_status("# Notes\nJust some text here.")
 
         assert status.total_tasks == 0
         assert status.completed_tasks == 0
 
-    def test_handles_uppercase_x(self, project_with_specs: Path) -> None:
+    def test_handles_uppercase_x(self) -> None:
         """function recognizes [X] as checked"""
-        from specbook.ui.web.app import _parse_completion_status
+        status = _parse_completion_status(
+            "- [X] Checked with uppercase\n- [x] Checked with lowercase"
+        )
 
-        tasks_file = project_with_specs / "tasks.md"
-        tasks_file.write_text("- [X] Checked with uppercase\n- [x] Checked with lowercase")
+        assert status.completed_tasks == 2
 
-        status = _parse_completion_status(tasks_file)
+    def test_counts_indented_subtasks(self) -> None:
+        """function counts nested (indented) checkboxes too"""
+        status = _parse_completion_status("- [x] Parent\n  - [ ] Child\n  - [X] Other child\n")
 
+        assert status.total_tasks == 3
         assert status.completed_tasks == 2
 
 
+class TestGetDocStatus:
+    """tests for get_doc_status / parse_frontmatter"""
+
+    def test_reads_status_from_frontmatter(self, temp_dir: Path) -> None:
+        """function returns the status declared in frontmatter"""
+        doc = temp_dir / "spec.md"
+        doc.write_text("---\ntitle: Spec\nStatus: In_Review\n---\n# Spec\n")
+
+        assert get_doc_status(doc) == SpecStatus.IN_REVIEW
+
+    def test_returns_draft_without_frontmatter(self, temp_dir: Path) -> None:
+        """function returns DRAFT for docs without frontmatter or missing files"""
+        doc = temp_dir / "spec.md"
+        doc.write_text("# Spec\n\nNo frontmatter here.\n")
+
+        assert get_doc_status(doc) == SpecStatus.DRAFT
+        assert get_doc_status(temp_dir / "missing.md") == SpecStatus.DRAFT
+
+    def test_returns_unknown_for_unrecognized_status(self, temp_dir: Path) -> None:
+        """function returns UNKNOWN for status values it does not recognize"""
+        doc = temp_dir / "spec.md"
+        doc.write_text("---\nstatus: someday\n---\n# Spec\n")
+
+        assert get_doc_status(doc) == SpecStatus.UNKNOWN
+
+    def test_reads_frontmatter_of_large_documents(self, temp_dir: Path) -> None:
+        """function finds status in long documents and in frontmatter past the read prefix"""
+        long_body = "# Spec\n" + "Lorem ipsum é dolor.\n" * 1000
+        doc = temp_dir / "spec.md"
+        doc.write_text("---\nstatus: complete\n---\n" + long_body, encoding="utf-8")
+        padded = temp_dir / "padded.md"
+        padded.write_text(
+            "---\nnotes: " + "x" * 5000 + "\nstatus: complete\n---\n" + long_body,
+            encoding="utf-8",
+        )
+
+        assert get_doc_status(doc) == SpecStatus.COMPLETE
+        assert get_doc_status(padded) == SpecStatus.COMPLETE
+
+    def test_frontmatter_must_open_the_document(self) -> None:
+        """parse_frontmatter allows leading whitespace but not text before the block"""
+        assert parse_frontmatter("\n  ---\nstatus: draft\n---\n") == {"status": "draft"}
+        assert parse_frontmatter("# Spec\n---\nstatus: draft\n---\n") == {}
+        assert parse_frontmatter("") == {}
+
+    def test_status_line_matches_yaml(self) -> None:
+        """_scan_status_line reads plain status lines and defers anything else to YAML"""
+        assert _scan_status_line("title: Spec\nStatus: 'in-review' # pending\n") == "in-review"
+        assert _scan_status_line("status: yes") is None
+        assert _scan_status_line("status: in\n  review") is None
+        assert _scan_status_line("status: draft\nstatus: complete") is None
+
+    def test_falls_back_to_yaml_for_complex_status(self, temp_dir: Path) -> None:
+        """function still resolves status values the line scan leaves to YAML"""
+        doc = temp_dir / "spec.md"
+        doc.write_text("---\nstatus: >-\n  approved\n---\n# Spec\n")
+
+        assert get_doc_status(doc) == SpecStatus.APPROVED
+
+    def test_invalid_yaml_is_ignored(self) -> None:
+        """parse_frontmatter returns an empty dict for invalid YAML"""
+        assert parse_frontmatter("---\nstatus: [unclosed\n---\n# Spec\n") == {}
+
+
 class TestDiscoverProjectDocuments:
     """tests for _discover_project_documents function"""
 
     def test_discovers_root_level_documents(self, project_with_specs: Path) -> None:
         """function discovers root-level markdown files"""
-        from specbook.ui.web.app import _discover_project_documents
-
         (project_with_specs / "CLAUDE.md").write_text("# Rules")
 
         docs = _discover_project_documents(project_with_specs)
@@ -783,8 +982,6 @@ class TestDiscoverProjectDocuments:
 
     def test_discovers_specify_memory_documents(self, project_with_specs: Path) -> None:
         """function discovers documents in .specify/memory/"""
-        from specbook.ui.web.app import _discover_project_documents
-
         memory_dir = project_with_specs / ".specify" / "memory"
         memory_dir.mkdir(parents=True)
         (memory_dir / "constitution.md").write_text("# Constitution")
@@ -793,3 +990,166 @@ class TestDiscoverProjectDocuments:
 
         assert len(docs) == 1
         assert "constitution.md" in docs[0].path.name
+
+
+class TestListingCache:
+    """tests for _get_project_listing caching"""
+
+    def test_reuses_listing_when_unchanged(self, project_with_specs: Path) -> None:
+        """function returns the cached listing when no files changed"""
+        _clear_listing_cache()
+        spec_dir = project_with_specs / "specs" / "001-core"
+        spec_dir.mkdir(parents=True)
+        (spec_dir / "spec.md").write_text("# Core")
+
+        _, first, _ = _get_project_listing(project_with_specs)
+        _, second, _ = _get_project_listing(project_with_specs)
+
+        assert second is first
+
+    def test_rebuilds_when_document_edited(self, project_with_specs: Path) -> None:
+        """function rebuilds the listing when a document is edited in place"""
+        _clear_listing_cache()
+        spec_dir = project_with_specs / "specs" / "001-core"
+        spec_dir.mkdir(parents=True)
+        tasks_file = spec_dir / "tasks.md"
+        tasks_file.write_text("- [ ] Task")
+
+        _, first, _ = _get_project_listing(project_with_specs)
+        tasks_file.write_text("- [x] Task\n- [ ] Another task")
+        _, second, _ = _get_project_listing(project_with_specs)
+
+        assert second is not first
+        assert second.specs[0].completion.total_tasks == 2
+        assert second.specs[0].completion.completed_tasks == 1
+
+    def test_rebuilds_despite_dangling_symlink(self, project_with_specs: Path) -> None:
+        """a broken .md symlink doesn't hide edits to the documents beside it"""
+        _clear_listing_cache()
+        for name in ("001-core", "002-next"):
+            spec_dir = project_with_specs / "specs" / name
+            spec_dir.mkdir(parents=True)
+            (spec_dir / "broken.md").symlink_to(spec_dir / "missing.md")
+            (spec_dir / "tasks.md").write_text("- [ ] Task")
+        (project_with_specs / "specs" / "broken.md").symlink_to("missing.md")
+
+        _, first, _ = _get_project_listing(project_with_specs)
+        for name in ("001-core", "002-next"):
+            (project_with_specs / "specs" / name / "tasks.md").write_text("- [x] Task\n- [ ] More")
+        _, second, _ = _get_project_listing(project_with_specs)
+
+        assert second is not first
+        assert [spec.completion.total_tasks for spec in second.specs] == [2, 2]
+
+    def test_rebuilds_when_spec_added(self, project_with_specs: Path) -> None:
+        """function rebuilds the listing when a spec directory is added"""
+        _clear_listing_cache()
+        (project_with_specs / "specs" / "001-core").mkdir()
+
+        _, first, _ = _get_project_listing(project_with_specs)
+        (project_with_specs / "specs" / "002-next").mkdir()
+        _, second, _ = _get_project_listing(project_with_specs)
+
+        assert [s.name for s in first.specs] == ["001-core"]
+        assert [s.name for s in second.specs] == ["001-core", "002-next"]
+
+    def test_rebuild_rereads_only_changed_documents(self, project_with_specs: Path) -> None:
+        """rebuild re-reads only documents whose mtime or size changed"""
+        _clear_listing_cache()
+        for name in ("001-core", "002-next"):
+            spec_dir = project_with_specs / "specs" / name
+            spec_dir.mkdir()
+            (spec_dir / "spec.md").write_text("# Spec")
+
+        _get_project_listing(project_with_specs)
+        misses = _cached_doc_status.cache_info().misses
+        (project_with_specs / "specs" / "002-next" / "spec.md").write_text("# Spec, edited")
+        _get_project_listing(project_with_specs)
+
+        assert _cached_doc_status.cache_info().misses == misses + 1
+
+
+class TestScanStore:
+    """tests for the persisted per-file scan store"""
+
+    def test_warm_start_reuses_persisted_scan_results(
+        self, project_with_specs: Path, isolated_cache_home: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """a new app serves unchanged documents from the store without re-reading them"""
+        spec_dir = project_with_specs / "specs" / "001-core"
+        spec_dir.mkdir()
+        (spec_dir / "spec.md").write_text("---\nstatus: approved\n---\n# Core\n")
+        (spec_dir / "tasks.md").write_text("- [x] One\n- [ ] Two\n")
+
+        TestClient(web_app.create_app(project_with_specs)).get("/")
+        assert list((isolated_cache_home / "specbook").glob("scan-*.json"))
+
+        def fail(*args: object) -> None:
+            raise AssertionError("document was re-read")
+
+        monkeypatch.setattr(web_app, "get_doc_status", fail)
+        monkeypatch.setattr(web_app, "_parse_completion_status", fail)
+        web_app.create_app(project_with_specs)
+        _, listing, _ = web_app._get_project_listing(project_with_specs)
+
+        spec = listing.specs[0]
+        assert {doc.name: doc.status for doc in spec.documents}["spec.md"] == SpecStatus.APPROVED
+        assert (spec.completion.total_tasks, spec.completion.completed_tasks) == (2, 1)
+
+    def test_ignores_entries_for_changed_files(self, project_with_specs: Path) -> None:
+        """a document edited while the server was down is scanned again"""
+        spec_dir = project_with_specs / "specs" / "001-core"
+        spec_dir.mkdir()
+        spec_file = spec_dir / "spec.md"
+        spec_file.write_text("---\nstatus: draft\n---\n# Core\n")
+
+        TestClient(web_app.create_app(project_with_specs)).get("/")
+        spec_file.write_text("---\nstatus: complete\n---\n# Core, done\n")
+        web_app.create_app(project_with_specs)
+        _, listing, _ = web_app._get_project_listing(project_with_specs)
+
+        assert listing.specs[0].documents[0].status == SpecStatus.COMPLETE
+
+    def test_drops_malformed_entries(
+        self, project_with_specs: Path, isolated_cache_home: Path
+    ) -> None:
+        """entries of the wrong shape are discarded on load instead of breaking a scan"""
+        spec_dir = project_with_specs / "specs" / "001-core"
+        spec_dir.mkdir()
+        (spec_dir / "spec.md").write_text("---\nstatus: approved\n---\n# Core\n")
+        tasks_file = spec_dir / "tasks.md"
+        tasks_file.write_text("- [x] One\n- [ ] Two\n")
+
+        TestClient(web_app.create_app(project_with_specs)).get("/")
+        (store_file,) = (isolated_cache_home / "specbook").glob("scan-*.json")
+        data = json.loads(store_file.read_text())
+        tasks_entry = data["files"][str(tasks_file)]
+        tasks_entry["tasks"] = ["2", None]
+        data["files"][str(spec_dir / "spec.md")] = "not an entry"
+        store_file.write_text(json.dumps(data))
+
+        response = TestClient(web_app.create_app(project_with_specs)).get("/")
+        _, listing, _ = web_app._get_project_listing(project_with_specs)
+
+        assert response.status_code == 200
+        spec = listing.specs[0]
+        assert {doc.name: doc.status for doc in spec.documents}["spec.md"] == SpecStatus.APPROVED
+        assert (spec.completion.total_tasks, spec.completion.completed_tasks) == (2, 1)
+
+    def test_runs_without_a_cache_dir(
+        self, project_with_specs: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """with no XDG_CACHE_HOME and no home dir, the app scans in memory only"""
+
+        def no_home() -> Path:
+            raise RuntimeError("Could not determine home directory.")
+
+        monkeypatch.delenv("XDG_CACHE_HOME")
+        monkeypatch.setattr(Path, "home", no_home)
+        (project_with_specs / "specs" / "001-core").mkdir()
+        (project_with_specs / "specs" / "001-core" / "spec.md").write_text("# Core\n")
+
+        response = TestClient(web_app.create_app(project_with_specs)).get("/")
+
+        assert response.status_code == 200
+        assert "001-core" in response.text